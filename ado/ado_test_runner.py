@@ -2,15 +2,22 @@ import base64
 import logging
 import os
 import platform
+import threading
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 import requests
 from requests.auth import HTTPBasicAuth
 
+from utils.ado.ado_attachment_stream import post_attachment, fit_video_to_attachment_limit
+from utils.ado.ado_client import get_ado_client
+from utils.ado.ado_metadata_cache import get_ado_metadata_cache
 from utils.ado.ado_test_step_reporter import attach_and_upload_step_log
+from utils.ado.ado_upload_queue import ADOUploadQueue
+from utils.generic.task_graph import run_task_graph
 
 MAX_COMMENT_LENGTH = 2048  # ADO limit for comments
+RESULT_PATCH_BATCH_SIZE = 100  # ADO limit for results per PATCH
 hitlLogger = logging.getLogger("HitlLogger")
 
 
@@ -25,6 +32,8 @@ class ADOTestRunner:
         self.org_url = test_meta.get("ado_org_url").rstrip("/")
         self.project = test_meta.get("ado_project")
         self.pat = os.getenv("HITL_ADO_PAT")
+        self.client = get_ado_client()
+        self.metadata_cache = get_ado_metadata_cache()
         self.is_pipeline = os.environ.get("IS_PIPELINE")
         self.run_id = None
         self.result_id = None
@@ -36,6 +45,22 @@ class ADOTestRunner:
         self.passed_test_count = 0
         self.failed_test_count = 0
         self.skipped_test_count = 0
+        self.failures = []
+        self.unreported_outcomes = []  # xdist: outcomes not yet streamed to the controller
+        self.reported_failure_count = 0
+        self.deferred_results = os.getenv("ADO_DEFERRED_RESULTS", "false").lower() == "true"
+        self.result_flush_interval = int(os.getenv("ADO_RESULT_FLUSH_SECONDS", "30"))
+        self.pending_result_updates = []
+        self.failed_result_updates = []
+        self._result_lock = threading.Lock()
+        self._flush_timer = None
+        self._flush_timer_stop = threading.Event()
+        self.uploader = ADOUploadQueue(
+            worker_count=int(os.getenv("ADO_UPLOAD_WORKERS", "4")),
+            max_queue_size=int(os.getenv("ADO_UPLOAD_QUEUE_SIZE", "32")),
+            enabled=os.getenv("ADO_ASYNC_UPLOADS", "true").lower() == "true"
+        )
+        self.failed_uploads = []
         self.headers = {
             "Authorization": "Basic " + base64.b64encode(f":{self.pat}".encode()).decode(),
             "Content-Type": "application/json"
@@ -50,18 +75,103 @@ class ADOTestRunner:
         duration_ms = int((end_time - start_time).total_seconds() * 1000)
 
         self.set_result_id_for_case(case_id)
-        self.patch_result(outcome, comment[:MAX_COMMENT_LENGTH])
-        self.patch_test_result_metadata(
-            duration_in_ms=duration_ms,
-            computer_name=self.get_computer_name(),
-            error_message=comment if outcome.lower() == "failed" else None
-        )
+        result_update = self.build_result_update(outcome, comment, duration_ms, steps)
+        if self.deferred_results:
+            with self._result_lock:
+                self.pending_result_updates.append(result_update)
+            self._start_flush_timer()
+        else:
+            self.patch_results([result_update])
+
         if outcome.lower() == "failed" and page:
             self.take_screen_shot(page, f"{case_id}_failure")
         if steps:
-            self.add_test_steps(steps)
             attach_and_upload_step_log(steps, self)
 
+        self.record_outcome(case_id, outcome)
+        self.unreported_outcomes.append((str(case_id), outcome))
+
+    def build_result_update(self, outcome: str, comment: str, duration_ms: int, steps: list = None) -> dict:
+        """
+        Outcome, timing, host, error and iteration steps for the current
+        result, merged into a single results PATCH entry.
+        """
+        result_update = {
+            "id": self.result_id,
+            "outcome": outcome,
+            "state": "Completed",
+            "comment": comment[:MAX_COMMENT_LENGTH],
+            "automatedTestName": f"TestCase_{self.case_id}",
+            "automatedTestType": "PlaywrightTest",
+            "automatedTestStorage": "playwright.automation",
+            "durationInMs": duration_ms,
+            "computerName": self.get_computer_name(),
+            "errorMessage": comment if outcome.lower() == "failed" else None
+        }
+        if steps:
+            result_update["iterationDetails"] = [{"steps": self.build_steps_html(steps)}]
+        return result_update
+
+    def patch_results(self, result_updates: list):
+        if not result_updates:
+            return
+        url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/results?api-version=7.1"
+        r = self.client.patch(url, headers=self.headers, json=result_updates)
+        try:
+            r.raise_for_status()
+            hitlLogger.info(f"✅ Patched {len(result_updates)} test result(s) in run {self.run_id}")
+        except requests.exceptions.HTTPError as e:
+            hitlLogger.info(f"❌ Failed to patch test results: {e}")
+            hitlLogger.info(f"🔍 Response: {r.text}")
+            raise
+
+    def flush_result_updates(self):
+        """
+        Send buffered result updates (deferred mode) in bulk PATCHes of up to
+        100. A rejected batch is kept in failed_result_updates and reported by
+        raise_for_failed_result_updates() at the end of the run.
+        """
+        with self._result_lock:
+            pending, self.pending_result_updates = self.pending_result_updates, []
+        for i in range(0, len(pending), RESULT_PATCH_BATCH_SIZE):
+            batch = pending[i:i + RESULT_PATCH_BATCH_SIZE]
+            try:
+                self.patch_results(batch)
+            except requests.exceptions.RequestException:
+                with self._result_lock:
+                    self.failed_result_updates.extend(batch)
+
+    def raise_for_failed_result_updates(self):
+        with self._result_lock:
+            failed = [update["id"] for update in self.failed_result_updates]
+        if failed:
+            raise RuntimeError(f"❌ ADO rejected {len(failed)} deferred result update(s), result ids: {failed}")
+
+    def stop_flush_timer(self):
+        self._flush_timer_stop.set()
+        if self._flush_timer is not None:
+            self._flush_timer.join()
+            self._flush_timer = None
+
+    def _start_flush_timer(self):
+        # Flush every result_flush_interval seconds even while a long test is running
+        with self._result_lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Thread(target=self._flush_periodically, name="ado-result-flush",
+                                                 daemon=True)
+            self._flush_timer.start()
+
+    def _flush_periodically(self):
+        while not self._flush_timer_stop.wait(self.result_flush_interval):
+            self.flush_result_updates()
+
+    def drain_uploads(self) -> list:
+        """Barrier: wait for queued attachment uploads and keep the ones that failed."""
+        self.failed_uploads = self.uploader.drain()
+        return self.failed_uploads
+
+    def record_outcome(self, case_id, outcome: str):
         if str(case_id) not in self.finalized_case_ids:
             self.executed_test_count += 1
             if outcome.lower() == "passed":
@@ -75,10 +185,44 @@ class ADOTestRunner:
 
         self.case_outcomes[str(case_id)] = outcome  # Track final outcome
 
+    def share_run_context(self) -> dict:
+        """
+        Run identifiers the xdist controller hands to every worker so that all
+        workers report into the single run created by the controller.
+        """
+        return {"run_id": self.run_id, "result_id_map": dict(self.result_id_map)}
+
+    def join_test_run(self, run_context: dict):
+        self.run_id = run_context["run_id"]
+        self.result_id_map = dict(run_context["result_id_map"])
+        self.all_test_case_ids = list(self.result_id_map.keys())
+        hitlLogger.info(f"🔗 Joined existing test run {self.run_id} with {len(self.result_id_map)} mapped result(s)")
+
+    def drain_worker_updates(self) -> dict:
+        """
+        Outcomes and failure names finalized on an xdist worker since the last
+        drain. They are shipped to the controller on the test report.
+        """
+        updates = {
+            "outcomes": self.unreported_outcomes,
+            "failures": self.failures[self.reported_failure_count:]
+        }
+        self.unreported_outcomes = []
+        self.reported_failure_count = len(self.failures)
+        return updates
+
+    def apply_worker_updates(self, updates: dict):
+        for case_id, outcome in updates.get("outcomes", []):
+            self.record_outcome(case_id, outcome)
+        self.failures.extend(updates.get("failures", []))
+
     def complete_run(self, summary: str = "Test execution completed."):
+        self.stop_flush_timer()
+        self.flush_result_updates()
+        self.drain_uploads()
         self.mark_remaining_tests_not_run()
         run_url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}?api-version=7.1"
-        run_resp = requests.get(run_url, headers=self.headers)
+        run_resp = self.client.get(run_url, headers=self.headers)
         run_resp.raise_for_status()
         existing_comment = run_resp.json().get("comment", "")
         final_comment = existing_comment + summary
@@ -87,9 +231,10 @@ class ADOTestRunner:
             "comment": final_comment[:MAX_COMMENT_LENGTH]
         }
         url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}?api-version=7.1"
-        r = requests.patch(url, headers=self.headers, json=payload)
+        r = self.client.patch(url, headers=self.headers, json=payload)
         r.raise_for_status()
         hitlLogger.info("✅ Test run marked as completed with preserved comment.")
+        self.raise_for_failed_result_updates()
 
     def mark_remaining_tests_not_run(self):
         not_run_cases = set(self.all_test_case_ids) - self.finalized_case_ids
@@ -115,7 +260,7 @@ class ADOTestRunner:
             hitlLogger.info("⚠️ No eligible test results to mark as NotRun.")
             return
         url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/results?api-version=7.1"
-        r = requests.patch(url, headers=self.headers, json=payload)
+        r = self.client.patch(url, headers=self.headers, json=payload)
         try:
             r.raise_for_status()
             hitlLogger.info(f"✅ Marked {len(payload)} test case(s) as NotRun.")
@@ -127,19 +272,36 @@ class ADOTestRunner:
     def start_test_run(self):
         """
         Start a new test run in Azure DevOps.
+        Independent lookups run concurrently; each step starts as soon as the
+        data it needs is available, so startup is bounded by the critical path:
+        plan name, suite points and latest build (+ its details) -> create run ->
+        result mapping, owner assignments and run metadata.
         """
-        # Get test plan and suite names for the run title
-        plan_name = self.get_plan_name()
-        suite_name = self.get_suite_name()
-        point_ids = self.get_all_point_ids()
-
-        # Get build information
-        build_id = self.get_latest_successful_build_number()
-        build_info = self.get_build_details(str(build_id))
-
-        # Get test case owners
-        test_case_owners = self.get_test_case_owners()
-
+        run_results = run_task_graph({
+            "plan_name": (self.get_plan_name, []),
+            "point_ids": (self.get_all_point_ids, []),
+            "build_id": (self.get_latest_successful_build_number, []),
+            "build_info": (lambda build_id: self.get_build_details(str(build_id)), ["build_id"]),
+            # Shares the points response with point_ids through the metadata cache
+            "test_case_owners": (lambda point_ids: self.get_test_case_owners(), ["point_ids"]),
+            "run_id": (self.create_run, ["plan_name", "point_ids", "build_id", "build_info"]),
+            "run_results": (lambda run_id: self.map_result_ids_from_run(), ["run_id"]),
+            "assignments": (
+                lambda test_case_owners, run_results: self.update_test_case_assignments(test_case_owners, run_results),
+                ["test_case_owners", "run_results"]
+            ),
+            "run_metadata": (lambda run_id, build_info: self.update_run_metadata(
+                release=build_info.get("buildNumber"),
+                release_stage=build_info.get("sourceBranch", "").split("/")[-1],
+                build_platform=build_info.get("queue", {}).get("name", "ubuntu-latest"),
+                build_flavor=build_info.get("repository", {}).get("type", "CI"),
+                test_settings="HITL-Automation",
+                lab_environment=build_info.get("queue", {}).get("name", "ubuntu-latest")
+            ), ["run_id", "build_info"]),
+        }, max_workers=int(os.getenv("ADO_BOOTSTRAP_WORKERS", "4")), label="ADO run bootstrap")
+        return run_results["run_id"]
+
+    def create_run(self, plan_name: str, point_ids: list, build_id, build_info: dict):
         # Metadata for comments
         comment = (
             f"🧱 Release: {build_info.get('buildNumber')} | "
@@ -150,7 +312,6 @@ class ADOTestRunner:
             f"🧪 Env: {self.test_env}"
         )
 
-        # Create test run
         url = f"{self.org_url}/{self.project}/_apis/test/runs?api-version=7.1"
         payload = {
             "name": f"{plan_name} - {self.suite_type.capitalize()} "
@@ -164,30 +325,15 @@ class ADOTestRunner:
             "comment": comment
         }
 
-        r = requests.post(url, headers=self.headers, json=payload)
+        r = self.client.post(url, headers=self.headers, json=payload)
         r.raise_for_status()
         self.run_id = r.json()["id"]
         hitlLogger.info(f"✅ Created test run with ID: {self.run_id}")
-
-        # Map result IDs for each test case
-        self.map_result_ids_from_run()
-        
-        # Update test case assignments to match test plan
-        self.update_test_case_assignments(test_case_owners)
-
-        # Update run metadata with configuration
-        self.update_run_metadata(
-            release=build_info.get("buildNumber"),
-            release_stage=build_info.get("sourceBranch", "").split("/")[-1],
-            build_platform=build_info.get("queue", {}).get("name", "ubuntu-latest"),
-            build_flavor=build_info.get("repository", {}).get("type", "CI"),
-            test_settings="HITL-Automation",
-            lab_environment=build_info.get("queue", {}).get("name", "ubuntu-latest")
-        )
+        return self.run_id
 
     def map_result_ids_from_run(self):
         url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/results?api-version=7.1"
-        r = requests.get(url, headers=self.headers)
+        r = self.client.get(url, headers=self.headers)
         r.raise_for_status()
         results = r.json().get("value", [])
         for result in results:
@@ -196,24 +342,20 @@ class ADOTestRunner:
             self.result_id_map[test_case_id] = result_id
             hitlLogger.info(f"✅ Mapped existing result_id {result_id} to test_case_id {test_case_id}")
         self.all_test_case_ids = list(self.result_id_map.keys())
+        return results
 
     def get_plan_name(self):
         url = f"{self.org_url}/{self.project}/_apis/test/plans/{self.plan_id}"
-        r = requests.get(url, headers=self.headers)
-        r.raise_for_status()
-        return r.json().get("name", "UnknownPlan")
+        return self.metadata_cache.get_json(url, self.headers).get("name", "UnknownPlan")
 
     def get_suite_name(self):
         url = f"{self.org_url}/{self.project}/_apis/test/plans/{self.plan_id}/suites/{self.suite_id}"
-        r = requests.get(url, headers=self.headers)
-        r.raise_for_status()
-        return r.json().get("name", "UnknownSuite")
+        return self.metadata_cache.get_json(url, self.headers).get("name", "UnknownSuite")
 
     def get_all_point_ids(self):
         url = f"{self.org_url}/{self.project}/_apis/test/plans/{self.plan_id}/suites/{self.suite_id}/points?api-version=7.1"
-        r = requests.get(url, headers=self.headers)
-        r.raise_for_status()
-        return [pt["id"] for pt in r.json().get("value", [])]
+        points = self.metadata_cache.get_json(url, self.headers, persist=False).get("value", [])
+        return [pt["id"] for pt in points]
 
     def get_test_case_owners(self):
         """
@@ -221,9 +363,7 @@ class ADOTestRunner:
         Returns a dictionary mapping test case IDs to their assigned owners.
         """
         url = f"{self.org_url}/{self.project}/_apis/test/plans/{self.plan_id}/suites/{self.suite_id}/points?api-version=7.1"
-        r = requests.get(url, headers=self.headers)
-        r.raise_for_status()
-        points = r.json().get("value", [])
+        points = self.metadata_cache.get_json(url, self.headers, persist=False).get("value", [])
         
         owners = {}
         for point in points:
@@ -247,21 +387,8 @@ class ADOTestRunner:
         self.result_id = self.result_id_map.get(str(case_id))
         hitlLogger.info(f"✅ Mapped result_id {self.result_id} for test_case_id {case_id}")
 
-    def patch_result(self, outcome: str, comment: str):
-        url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/results?api-version=7.0"
-        payload = [{
-            "id": self.result_id,
-            "outcome": outcome,
-            "state": "Completed",
-            "comment": comment,
-            "automatedTestName": f"TestCase_{self.case_id}",
-            "automatedTestType": "PlaywrightTest",
-            "automatedTestStorage": "playwright.automation"
-        }]
-        r = requests.patch(url, headers=self.headers, json=payload)
-        r.raise_for_status()
-
-    def add_test_steps(self, steps: list):
+    @staticmethod
+    def build_steps_html(steps: list) -> str:
         steps_html = "<steps id='0'>"
         for idx, step in enumerate(steps, start=1):
             steps_html += (
@@ -272,14 +399,7 @@ class ADOTestRunner:
                 f"</step>"
             )
         steps_html += "</steps>"
-
-        payload = [{
-            "id": self.result_id,
-            "iterationDetails": [{"steps": steps_html}]
-        }]
-        url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/results?api-version=7.1"
-        r = requests.patch(url, headers=self.headers, json=payload)
-        r.raise_for_status()
+        return steps_html
 
     def take_screen_shot(self, page, base_filename):
         try:
@@ -289,54 +409,34 @@ class ADOTestRunner:
             os.makedirs(screenshots_dir, exist_ok=True)
             screenshot_path = os.path.join(screenshots_dir, filename)
             page.screenshot(path=screenshot_path, full_page=False)
-            self.attach_file(screenshot_path, "Failure screenshot")
+            self.uploader.submit(f"screenshot {filename} -> result {self.result_id}",
+                                 self.attach_file, screenshot_path, "Failure screenshot", self.result_id)
         except Exception as e:
             hitlLogger.info(f"❌ Screenshot capture failed: {e}")
 
-    def attach_video(self, file_path: str, comment: str):
+    def attach_video(self, file_path: str, comment: str, result_id=None):
+        # result_id is captured at queue time; self.result_id moves on with the next test
+        result_id = result_id or self.result_id
         if not os.path.exists(file_path):
             hitlLogger.info(f"⚠️ File does not exist: {file_path}")
             return
-        with open(file_path, "rb") as f:
-            content = base64.b64encode(f.read()).decode("utf-8")
-        url = f"{self.org_url}/{self.project}/_apis/test/Runs/{self.run_id}/Results/{self.result_id}/attachments?api-version=7.1"
-        payload = {
-            "stream": content,
-            "fileName": os.path.basename(file_path),
-            "comment": comment,
-            "attachmentType": "GeneralAttachment"  # ✅ Use this for all file types
-        }
-        r = requests.post(url, headers=self.headers, json=payload)
-        r.raise_for_status()
+        upload_path = fit_video_to_attachment_limit(file_path)
+        if not upload_path:
+            return
+        url = f"{self.org_url}/{self.project}/_apis/test/Runs/{self.run_id}/Results/{result_id}/attachments?api-version=7.1"
+        post_attachment(self.client, url, self.headers, upload_path, comment)
 
-    def attach_file(self, file_path: str, comment: str):
+    def attach_file(self, file_path: str, comment: str, result_id=None):
+        result_id = result_id or self.result_id
         if not os.path.exists(file_path):
             hitlLogger.info(f"⚠️ File does not exist: {file_path}")
             return
-        with open(file_path, "rb") as f:
-            content = base64.b64encode(f.read()).decode("utf-8")
-        url = f"{self.org_url}/{self.project}/_apis/test/Runs/{self.run_id}/Results/{self.result_id}/attachments?api-version=7.1"
-        payload = {
-            "stream": content,
-            "fileName": os.path.basename(file_path),
-            "comment": comment,
-            "attachmentType": "GeneralAttachment"
-        }
-        r = requests.post(url, headers=self.headers, json=payload)
-        r.raise_for_status()
+        url = f"{self.org_url}/{self.project}/_apis/test/Runs/{self.run_id}/Results/{result_id}/attachments?api-version=7.1"
+        post_attachment(self.client, url, self.headers, file_path, comment)
 
     def attach_to_run(self, file_path: str, comment: str = "HITL Run summary") -> None:
-        with open(file_path, "rb") as f:
-            content = base64.b64encode(f.read()).decode("utf-8")
         url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/attachments?api-version=7.1"
-        payload = {
-            "stream": content,
-            "fileName": os.path.basename(file_path),
-            "comment": comment,
-            "attachmentType": "GeneralAttachment"
-        }
-        r = requests.post(url, headers=self.headers, json=payload)
-        r.raise_for_status()
+        post_attachment(self.client, url, self.headers, file_path, comment)
         hitlLogger.info(f"✅ Summary attached at RUN level: {file_path}")
 
     def get_latest_successful_build_number(self) -> str:
@@ -350,16 +450,9 @@ class ADOTestRunner:
             "api-version": "7.1-preview.7"
         }
 
-        response = requests.get(
-            url,
-            params=params,
-            auth=HTTPBasicAuth('', self.pat)
-        )
-
-        if response.status_code != 200:
-            raise Exception(f"Failed to get builds: {response.status_code} - {response.text}")
-
-        builds = response.json().get("value", [])
+        # "Latest" changes with every pipeline build, so it is never read from or written to the disk cache
+        builds = self.metadata_cache.get_json(url, {}, params=params, auth=HTTPBasicAuth('', self.pat),
+                                              persist=False).get("value", [])
         if not builds:
             raise Exception("No successful builds found.")
 
@@ -370,9 +463,7 @@ class ADOTestRunner:
         Fetch extended build details from Azure DevOps based on a build ID.
         """
         url = f"{self.org_url}/{self.project}/_apis/build/builds/{build_id}?api-version=7.1-preview.7"
-        r = requests.get(url, headers=self.headers, auth=HTTPBasicAuth('', self.pat))
-        r.raise_for_status()
-        return r.json()
+        return self.metadata_cache.get_json(url, self.headers, auth=HTTPBasicAuth('', self.pat))
 
     def update_run_metadata(self,
                             release: str = None,
@@ -401,7 +492,7 @@ class ADOTestRunner:
             return
 
         url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}?api-version=5.1-preview.3"
-        r = requests.patch(url, headers=self.headers, json=payload)
+        r = self.client.patch(url, headers=self.headers, json=payload)
         try:
             r.raise_for_status()
             hitlLogger.info("✅ ADO test run metadata updated.")
@@ -409,27 +500,6 @@ class ADOTestRunner:
             hitlLogger.info(f"❌ Failed to update run metadata: {e}")
             hitlLogger.info(f"🔍 Response: {r.text}")
 
-    def patch_test_result_metadata(self, duration_in_ms=0, computer_name=None, error_message=None):
-        if not self.result_id:
-            hitlLogger.info("⚠️ No result_id to patch result metadata.")
-            return
-
-        payload = [{
-            "id": self.result_id,
-            "durationInMs": duration_in_ms,
-            "computerName": computer_name,
-            "errorMessage": error_message
-        }]
-
-        url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/results?api-version=7.1"
-        r = requests.patch(url, headers=self.headers, json=payload)
-        try:
-            r.raise_for_status()
-            hitlLogger.info(f"✅ Patched test result metadata for result_id {self.result_id}")
-        except requests.exceptions.HTTPError as e:
-            hitlLogger.info(f"❌ Failed to patch test result metadata: {e}")
-            hitlLogger.info(f"🔍 Response: {r.text}")
-
     def get_computer_name(self) -> str:
         return (
                 os.getenv("COMPUTERNAME") or
@@ -451,7 +521,7 @@ class ADOTestRunner:
             "state": state,
             "values": values or []
         }
-        r = requests.post(url, headers=self.headers, json=payload)
+        r = self.client.post(url, headers=self.headers, json=payload)
         try:
             r.raise_for_status()
             config_id = r.json()["id"]
@@ -464,7 +534,7 @@ class ADOTestRunner:
 
     def assign_configuration_to_suite_cases(self, configuration_id: int):
         url = f"{self.org_url}/{self.project}/_apis/test/plans/{self.plan_id}/suites/{self.suite_id}/points?api-version=7.1-preview.2"
-        response = requests.get(url, headers=self.headers)
+        response = self.client.get(url, headers=self.headers)
         response.raise_for_status()
         points = response.json().get("value", [])
 
@@ -474,7 +544,7 @@ class ADOTestRunner:
 
         payload = [{"id": pt["id"], "configuration": {"id": configuration_id}} for pt in points]
 
-        r = requests.patch(url, headers=self.headers, json=payload)
+        r = self.client.patch(url, headers=self.headers, json=payload)
         try:
             r.raise_for_status()
             hitlLogger.info(f"✅ Assigned configuration ID {configuration_id} to {len(payload)} test point(s).")
@@ -482,19 +552,20 @@ class ADOTestRunner:
             hitlLogger.info(f"❌ Failed to assign configuration: {e}")
             hitlLogger.info(f"🔍 Response: {r.text}")
 
-    def update_test_case_assignments(self, test_case_owners):
+    def update_test_case_assignments(self, test_case_owners, results: list = None):
         """
         Update test case assignments in the test run to match the test plan.
+        Pass the run results already fetched by map_result_ids_from_run to skip a second GET.
         """
         if not test_case_owners:
             hitlLogger.info("⚠️ No test case owners found to update")
             return
 
-        # First, get all test results from the run
         url = f"{self.org_url}/{self.project}/_apis/test/runs/{self.run_id}/results?api-version=7.1"
-        r = requests.get(url, headers=self.headers)
-        r.raise_for_status()
-        results = r.json().get("value", [])
+        if results is None:
+            r = self.client.get(url, headers=self.headers)
+            r.raise_for_status()
+            results = r.json().get("value", [])
 
         # Prepare updates for each test case
         updates = []
@@ -514,7 +585,7 @@ class ADOTestRunner:
             # Update test case assignments in batches of 100
             for i in range(0, len(updates), 100):
                 batch = updates[i:i + 100]
-                r = requests.patch(url, headers=self.headers, json=batch)
+                r = self.client.patch(url, headers=self.headers, json=batch)
                 r.raise_for_status()
                 hitlLogger.info(f"✅ Updated {len(batch)} test case assignments in the run (batch {i//100 + 1})")
         else:
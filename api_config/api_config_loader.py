@@ -1,4 +1,5 @@
 import base64
+import os
 from pathlib import Path
 
 import yaml
@@ -30,6 +31,35 @@ def load_config():
     return config
 
 
+def load_load_test_settings() -> dict:
+    """
+    Load-test sizing from settings.yaml (Workers / TasksPerWorker / DurationSeconds /
+    Concurrency / TargetRps / TestTag). Each key has a LOAD_TEST_* env override
+    (LOAD_TEST_WORKERS, LOAD_TEST_TASKS_PER_WORKER, LOAD_TEST_DURATION_SECONDS,
+    LOAD_TEST_CONCURRENCY, LOAD_TEST_TARGET_RPS, LOAD_TEST_TAG). A duration, when
+    set, replaces the request count; concurrency defaults to Workers.
+    """
+    base_path = Path(__file__).resolve().parent.parent
+    config_path = base_path / "api_config" / "settings.yaml"
+
+    if not config_path.exists():
+        raise FileNotFoundError(f"❌ settings.yaml not found at: {config_path}")
+
+    with open(config_path) as f:
+        config = yaml.safe_load(f) or {}
+
+    workers = int(os.getenv("LOAD_TEST_WORKERS", config.get("Workers", 1)))
+    return {
+        "workers": workers,
+        "tasks_per_worker": int(os.getenv("LOAD_TEST_TASKS_PER_WORKER", config.get("TasksPerWorker", 1))),
+        "duration_seconds": float(os.getenv("LOAD_TEST_DURATION_SECONDS", config.get("DurationSeconds") or 0)) or None,
+        "concurrency": int(os.getenv("LOAD_TEST_CONCURRENCY", config.get("Concurrency") or 0)) or workers,
+        "target_rps": float(os.getenv("LOAD_TEST_TARGET_RPS", config.get("TargetRps") or 0)) or None,
+        "test_tag": os.getenv("LOAD_TEST_TAG", config.get("TestTag", "Load_test")),
+        "is_az_pipeline": config.get("IsAZPipeline")
+    }
+
+
 if __name__ == "__main__":
     config = load_config()
     import pprint
@@ -14,14 +14,24 @@ from playwright.sync_api import sync_playwright
 
 from ado.ado_test_runner import ADOTestRunner
 from dao.test_execution_db_updater_dao import DBReporter
-from db_engine.test_automation_engine import get_test_db_engine
+from dao.test_telemetry_writer import drain_test_telemetry_writer
+from db_engine.test_automation_engine import get_test_db_engine, dispose_all_engines
 from db_models.ui_test_db_models import Base
 from domain_models.test_user_model import load_user_config_from_excel
 from email_utility.email_util import get_timestamped_filename
+from lib.hitl_logger import get_action_stats, get_highlight_mode
+from utils.ado.ado_client import get_ado_client
+from utils.ado.ado_metadata_cache import get_ado_metadata_cache
 from utils.ado.ado_test_case_enricher import enrich_yaml_with_ado_test_case
 from utils.ado.ado_test_plan_reader import fetch_total_planned_cases
 from utils.allure.allure_writer import write_allure_environment_file, generate_fancy_summary, \
     allure_generate_categories_and_piecharts
+from utils.api.token_manager.token_cache import get_token_cache
+from utils.browser.asset_cache import get_asset_cache
+from utils.browser.auth_state_cache import get_auth_state_cache
+from utils.browser.browser_pool import BrowserPool
+from utils.browser.video_policy import get_video_policy, should_record_video, should_keep_video
+from utils.browser.waits import get_wait_stats
 from utils.generic.get_project_root import get_project_root
 from utils.generic.logger_config import configure_logging
 from utils.generic.screenshots_cleanup import clean_screenshots_dir
@@ -180,46 +190,95 @@ def setup_db():
     Base.metadata.create_all(engine)
 
 
-@pytest.fixture(scope="function")
-def browser():
+@pytest.fixture(scope="session")
+def playwright_instance():
     with sync_playwright() as p:
-        headless = os.getenv("HEADLESS", "true").lower() == "true"
-        browser = p.chromium.launch(
-            headless=headless,
-            args=["--window-size=1980,1080", "--window-position=0,0"]
-            # devtools=True
-        )
-        yield browser
-        browser.close()
+        yield p
+
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright_instance):
+    # Session scope == once per xdist worker process
+    headless = os.getenv("HEADLESS", "true").lower() == "true"
+    recycle_after = int(os.getenv("BROWSER_RECYCLE_AFTER", "25"))
+    pool = BrowserPool(playwright_instance, headless=headless, recycle_after=recycle_after)
+    yield pool
+    pool.close()
+    get_asset_cache().log_stats()
 
 
 @pytest.fixture(scope="function")
-def context(browser, request, ado_runner):
-    video_dir = os.path.join(BASE_DIR, "videos")
-    os.makedirs(video_dir, exist_ok=True)
+def browser(browser_pool):
+    return browser_pool.get_browser()
+
 
-    context = browser.new_context(no_viewport=True, record_video_dir=video_dir)
+@pytest.fixture(scope="function")
+def context(browser_pool, request, ado_runner, test_user):
+    video_dir = os.path.join(BASE_DIR, "videos")
+    video_policy = get_video_policy()
+    video_options = {}
+    if should_record_video(video_policy, request.node):
+        os.makedirs(video_dir, exist_ok=True)
+        video_options["record_video_dir"] = video_dir
+
+    auth_cache = get_auth_state_cache()
+    auth_options = auth_cache.context_options(test_user)
+    asset_cache = get_asset_cache()
+    context = browser_pool.new_context(no_viewport=True, **video_options, **auth_options,
+                                       **asset_cache.context_options())
+    if auth_options:
+        auth_cache.mark_injected(context)
+    asset_cache.attach(context)
     request.node.video_info = {}  # Init
 
+    # trace highlight mode: LoggerPage labels each action as a group inside this trace
+    trace_actions = get_highlight_mode() == "trace"
+    if trace_actions:
+        context.tracing.start(screenshots=True, snapshots=True)
+
     yield context  # ⬅️ page will be created by `page` fixture
 
+    if trace_actions:
+        save_trace(context, request.node)
+
+    # Access pages AFTER yield when they have been created; videos are only written once the context closes
+    videos = [page.video for page in context.pages if page.video] if video_options else []
+    keep_video = bool(videos) and should_keep_video(video_policy, request.node)
     try:
-        # Access page AFTER yield when it has been created
-        pages = context.pages
-        if pages:
-            page = pages[0]
-            video = getattr(page, "video", None)
-            if video:
-                orig = video.path()
-                meta = getattr(request.node, "meta", {})
-                case_id = str(meta.get("ado_case_id", "unknown"))
-                ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-                new = os.path.join(video_dir, f"video_{case_id}_{ts}.webm")
-                request.node.video_info = {"original": orig, "renamed": new, "case_id": case_id}
+        if keep_video:
+            orig = videos[0].path()
+            meta = getattr(request.node, "meta", {})
+            case_id = str(meta.get("ado_case_id", "unknown"))
+            ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+            new = os.path.join(video_dir, f"video_{case_id}_{ts}.webm")
+            request.node.video_info = {"original": orig, "renamed": new, "case_id": case_id}
     except Exception as e:
         hitlLogger.warning(f"⚠️ Video finalization failed: {e}")
 
-    context.close()
+    browser_pool.release_context(context)
+
+    if videos and not keep_video:
+        # Passing test under retain-on-failure: drop the recording before it is renamed or uploaded
+        for video in videos:
+            try:
+                video.delete()
+            except Exception as e:
+                hitlLogger.warning(f"⚠️ Could not delete video: {e}")
+        hitlLogger.info(f"🎞️ Discarded {len(videos)} video(s) of passing test ({video_policy})")
+
+
+def save_trace(context, item):
+    trace_dir = os.path.join(BASE_DIR, "traces")
+    os.makedirs(trace_dir, exist_ok=True)
+    case_id = str(getattr(item, "meta", {}).get("ado_case_id", "unknown"))
+    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    trace_path = os.path.join(trace_dir, f"trace_{case_id}_{ts}.zip")
+    try:
+        context.tracing.stop(path=trace_path)
+        allure.attach.file(trace_path, name="Playwright trace", extension="zip")
+        hitlLogger.info(f"🧵 Saved Playwright trace: {trace_path}")
+    except Exception as e:
+        hitlLogger.warning(f"⚠️ Could not save Playwright trace: {e}")
 
 
 @pytest.fixture(scope="function")
@@ -228,8 +287,12 @@ def page(context):
 
 
 def pytest_sessionstart(session):
-    clean_test_steps()
     configure_logging()
+    if is_xdist_worker(session.config):
+        # Shared folders and Allure metadata are prepared once by the controller
+        return
+
+    clean_test_steps()
     hitlLogger.info("🧹 Cleaning screenshots and videos folder before test session...")
 
     # Clean screenshots directory
@@ -269,12 +332,19 @@ def pytest_sessionstart(session):
     except Exception as e:
         hitlLogger.warning(f"⚠️ Exception during writing allure environment file: {e}")
 
+    if is_xdist_controller(session.config):
+        start_controller_ado_run(session)
+
 
 def pytest_sessionfinish(session, exitstatus):
     if not hasattr(session, "ado_runner"):
         hitlLogger.warning("⚠️ 'ado_runner' not available — skipping Allure reporting.")
         return
 
+    if is_xdist_controller(session.config):
+        # Every worker has reported back; close the single run once
+        finish_ado_run(session.ado_runner, session.ado_meta, session.test_user_obj)
+
     for item in getattr(session, "items", []):
         info = getattr(item, "video_info", {})
         orig, renamed, case_id = info.get("original"), info.get("renamed"), info.get("case_id")
@@ -282,9 +352,16 @@ def pytest_sessionfinish(session, exitstatus):
             try:
                 os.rename(orig, renamed)
                 session.ado_runner.set_result_id_for_case(case_id)
-                session.ado_runner.attach_video(renamed, comment="Test session video")
+                session.ado_runner.uploader.submit(f"video {os.path.basename(renamed)}",
+                                                   session.ado_runner.attach_video, renamed,
+                                                   "Test session video", session.ado_runner.result_id)
             except Exception as e:
                 hitlLogger.warning(f"❌ Could not finalize video {orig}: {e}")
+    session.ado_runner.drain_uploads()
+
+    if is_xdist_worker(session.config):
+        # Reports, run attachments and email are produced once by the controller
+        return
 
     os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
     screenshots_zip = os.path.join(SCREENSHOTS_DIR, get_timestamped_filename("screenshots_bundle", "zip"))
@@ -343,6 +420,8 @@ def reporter(request, test_user):
         ado_case_id=meta.get("ado_case_id"),
         build_definition_id=meta.get("build_definition_id")
     )
+    # Buffered steps must reach the DB even when the test or the outcome update blows up
+    request.addfinalizer(db.close)
     yield db
     if not db._execution_ended:
         status = getattr(request.node, "rep_call", None)
@@ -356,19 +435,49 @@ def reporter(request, test_user):
 
 @pytest.fixture(scope="session", autouse=True)
 def ado_runner(request, test_user):
-    meta = load_test_meta(test_user, get_meta_path_from_test_file("test_product_task_resolve.py"))
-    meta = enrich_yaml_with_ado_test_case(meta)
-    runner = ADOTestRunner(meta)
-    runner.start_test_run()
+    runner, meta = create_ado_runner(test_user)
     request.session.ado_runner = runner
-    runner.failures = []
+
+    if is_xdist_worker(request.config):
+        # The xdist controller owns the ADO run; workers only report results into it
+        runner.join_test_run(request.config.workerinput["ado_run_context"])
+        yield runner
+        runner.stop_flush_timer()
+        runner.flush_result_updates()
+        runner.drain_uploads()
+        request.session.test_user_obj = test_user
+        runner.raise_for_failed_result_updates()
+        return
+
+    runner.start_test_run()
     yield runner
+    finish_ado_run(runner, meta, test_user)
+
+    request.session.test_user_obj = test_user
+
+
+def is_xdist_worker(config):
+    return hasattr(config, "workerinput")
+
+
+def is_xdist_controller(config):
+    return not is_xdist_worker(config) and bool(getattr(config.option, "numprocesses", None))
+
+
+def create_ado_runner(test_user):
+    meta = load_test_meta(test_user, get_meta_path_from_test_file("test_product_task_resolve.py"))
+    meta = enrich_yaml_with_ado_test_case(meta)
+    return ADOTestRunner(meta), meta
+
+
+def finish_ado_run(runner, meta, test_user):
     summary = f"❌ {len(runner.failures)} failed: {', '.join(runner.failures)}" if runner.failures else "✅ All tests passed."
     ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
     path = os.path.join(SCREENSHOTS_DIR, f"ado_test_run_summary_{ts}.txt")
     with open(path, "w", encoding="utf-8") as f:
         f.write(summary)
-    runner.attach_to_run(path, comment="Run summary")
+    runner.uploader.submit("run summary", runner.attach_to_run, path, "Run summary")
 
     run_env = os.getenv("RUN_ENV", "").lower() or test_user.test_env
     is_pipeline = os.getenv("IS_PIPELINE", "local").lower()
@@ -404,19 +513,67 @@ def ado_runner(request, test_user):
 
     runner.complete_run(run_summary_comment)
 
-    request.session.test_user_obj = test_user
+
+ado_controller_runner = None
+
+
+def start_controller_ado_run(session):
+    """
+    Under xdist the controller creates the single ADO run and maps result IDs
+    once; pytest_configure_node then hands the run context to every worker.
+    """
+    global ado_controller_runner
+    excel_path = os.path.join(BASE_DIR, "user-config", "test_user_config.xlsx")
+    test_user = load_user_config_from_excel(excel_path)
+    if not test_user:
+        pytest.exit("❌ test_user_config.xlsx missing or unreadable.")
+    try:
+        runner, meta = create_ado_runner(test_user)
+        runner.start_test_run()
+    except Exception as e:
+        pytest.exit(f"❌ xdist controller could not start the ADO test run: {e}")
+
+    session.ado_runner = runner
+    session.ado_meta = meta
+    session.test_user_obj = test_user
+    session.config.ado_runner = runner
+    ado_controller_runner = runner
+    hitlLogger.info(f"🧭 xdist controller created ADO test run {runner.run_id}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    runner = getattr(node.config, "ado_runner", None)
+    if runner:
+        node.workerinput["ado_run_context"] = runner.share_run_context()
 
 
-@pytest.hookimpl
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    yield
+    # Worker side: ship outcomes finalized during this test on the teardown report
+    if is_xdist_worker(item.config) and hasattr(item.session, "ado_runner"):
+        updates = item.session.ado_runner.drain_worker_updates()
+        if updates["outcomes"] or updates["failures"]:
+            item.user_properties.append(("ado_worker_updates", updates))
+
+
+def pytest_runtest_logreport(report):
+    # Controller side: fold streamed worker outcomes into the single run
+    if ado_controller_runner is None or report.when != "teardown":
+        return
+    for name, value in getattr(report, "user_properties", []):
+        if name == "ado_worker_updates":
+            ado_controller_runner.apply_worker_updates(value)
+
+
+@pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    @pytest.hookimpl
-    def pytest_runtest_makereport(item, call):
-        if call.when == "call":
-            setattr(item, "rep_call", call)
-            if call.excinfo and call.excinfo.type.__name__ == "AssertionError":
-                # Automatically mark test as failed for email tracking
-                if hasattr(item.session, "ado_runner") and hasattr(item.session.ado_runner, "failures"):
-                    item.session.ado_runner.failures.append(item.name)
+    outcome = yield
+    report = outcome.get_result()
+    # rep_setup / rep_call: read by fixture teardown (reporter outcome, video retention).
+    # Failures are recorded for the email by the ado_*_testcase decorators, not here.
+    setattr(item, f"rep_{report.when}", report)
 
 
 def add_email_notification_on_failure(session, runner, screenshots_dir, allure_results_dir, test_user):
@@ -499,6 +656,8 @@ def add_email_notification_on_failure(session, runner, screenshots_dir, allure_r
 
 def pytest_addoption(parser):
     parser.addoption("--suite-type", action="store", default="", help="Suite type: regression/smoke/standalone")
+    parser.addoption("--highlight-mode", action="store", default="", choices=("", "demo", "ci", "trace"),
+                     help="LoggerPage highlight mode: demo/ci/trace (overrides HITL_HIGHLIGHT_MODE)")
 
 
 def pytest_configure(config):
@@ -519,3 +678,18 @@ def pytest_configure(config):
             suite_type = "unidentified test"
 
     os.environ["SUITE_TYPE"] = suite_type
+
+    highlight_mode = config.getoption("--highlight-mode")
+    if highlight_mode:
+        os.environ["HITL_HIGHLIGHT_MODE"] = highlight_mode
+
+
+def pytest_unconfigure(config):
+    get_ado_client().log_metrics()
+    get_ado_metadata_cache().log_stats()
+    get_token_cache().log_stats()
+    get_wait_stats().log_stats()
+    get_action_stats().log_stats()
+    # Pending telemetry rows need the pooled engines, so drain before disposing them
+    drain_test_telemetry_writer()
+    dispose_all_engines()
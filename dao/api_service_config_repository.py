@@ -0,0 +1,87 @@
+import logging
+import threading
+from typing import Dict, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from db_engine.test_automation_engine import get_test_db_engine
+from db_models.api_test_db_models import APIServiceConfig
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+
+class APIServiceConfigRepository:
+    """
+    In-memory view of API_Test_Service_Config. All enabled rows of an env are
+    loaded with one query the first time the env is used and indexed by
+    request_type / service_desc, so API helpers make no config round trips.
+    Call refresh() after changing the table mid-session.
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, List[APIServiceConfig]] = {}
+        self._index: Dict[str, Dict[tuple, APIServiceConfig]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, service_env: str, request_type: str = None, service_desc: str = None) -> APIServiceConfig:
+        config = self.find(service_env, request_type, service_desc)
+        if not config:
+            raise ValueError(f"No service config found for env: {service_env}"
+                             f"{f', request_type: {request_type}' if request_type else ''}"
+                             f"{f', service_desc: {service_desc}' if service_desc else ''}")
+        return config
+
+    def find(self, service_env: str, request_type: str = None, service_desc: str = None) -> Optional[APIServiceConfig]:
+        """First row (by Service_Id) of the env matching the given filters, or None."""
+        rows, index = self._load(service_env)
+        if request_type is not None and service_desc is not None:
+            return index.get((request_type, service_desc))
+        for config in rows:
+            if request_type is not None and config.request_type != request_type:
+                continue
+            if service_desc is not None and config.service_desc != service_desc:
+                continue
+            return config
+        return None
+
+    def all(self, service_env: str) -> List[APIServiceConfig]:
+        return list(self._load(service_env)[0])
+
+    def refresh(self, service_env: str = None):
+        with self._lock:
+            if service_env is None:
+                self._rows.clear()
+                self._index.clear()
+            else:
+                self._rows.pop(service_env, None)
+                self._index.pop(service_env, None)
+
+    def _load(self, service_env: str):
+        with self._lock:
+            rows = self._rows.get(service_env)
+            if rows is None:
+                with Session(get_test_db_engine()) as session:
+                    rows = (
+                        session.query(APIServiceConfig)
+                        .filter(APIServiceConfig.service_env == service_env)
+                        .filter(or_(APIServiceConfig.is_enabled.is_(None), APIServiceConfig.is_enabled.is_(True)))
+                        .order_by(APIServiceConfig.service_id)
+                        .all()
+                    )
+                    # Keep the loaded attribute values usable after the session closes
+                    session.expunge_all()
+                self._rows[service_env] = rows
+                index = {}
+                for config in rows:
+                    index.setdefault((config.request_type, config.service_desc), config)
+                self._index[service_env] = index
+                hitlLogger.info(f"✅  Loaded {len(rows)} API service config row(s) for env: {service_env}")
+            return rows, self._index[service_env]
+
+
+_service_config_repository = APIServiceConfigRepository()
+
+
+def get_service_config_repository() -> APIServiceConfigRepository:
+    return _service_config_repository
@@ -1,3 +1,6 @@
+from typing import List
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from db_models.api_test_db_models import APITestRun, APITestResult, APITestCaseConfig, APIUITaskMapping, \
@@ -36,6 +39,15 @@ class APITestDAO:
         session.refresh(record)
         return record
 
+    # ✅ Bulk insert API_Test_Result (one executemany, one commit)
+    @staticmethod
+    def bulk_insert_test_results(session: Session, rows: List[dict]) -> int:
+        if not rows:
+            return 0
+        session.execute(insert(APITestResult), rows)
+        session.commit()
+        return len(rows)
+
     @staticmethod
     def update_test_result(session: Session, result_id: int, updates: dict) -> APITestResult:
         record = session.query(APITestResult).filter_by(test_result_id=result_id).first()
@@ -1,11 +1,13 @@
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
-from sqlalchemy import MetaData, update, select, or_
+from sqlalchemy import update, select, or_, func
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
+from db_engine.table_metadata_cache import get_reflected_table
+
 hitlLogger = logging.getLogger("HitlLogger")
 
 
@@ -20,39 +22,55 @@ class TaskIdMapperDAO:
         self.engine = engine
         self.schema = schema
         self.table_name = table_name
-        self.metadata = MetaData()
 
         try:
-            self.metadata.reflect(bind=self.engine, schema=self.schema, only=[self.table_name])
-            self.table = self.metadata.tables[f"{self.schema}.{self.table_name}"]
-            hitlLogger.info(f"✅  Table loaded: {self.schema}.{self.table_name}")
+            # Reflected once per process and shared by every DAO instance
+            self.table = get_reflected_table(self.engine, self.table_name, self.schema)
         except Exception as e:
             hitlLogger.error(f"❌ Failed to load table '{self.schema}.{self.table_name}': {e}")
             raise
 
-    def update_task_status_to_resolved(self, test_user, task_id: str) -> int:
-        stmt = (
-            update(self.table)
-            .where(self.table.c.TaskId == task_id)
-            .where(self.table.c.Env == test_user.test_env)
-            .values(Status="Resolved")
+    def update_status_bulk(self, task_ids: List, status: str, env: str) -> Dict[str, int]:
+        """
+        Sets Status for all task_ids in one UPDATE ... WHERE TaskId IN (...) and
+        one transaction. Returns the number of rows updated per TaskId (as str);
+        every TaskId maps to 0 when the update fails.
+        """
+        task_ids = [str(task_id) for task_id in task_ids]
+        results = {task_id: 0 for task_id in task_ids}
+        if not task_ids:
+            return results
+
+        matches = (
+            self.table.c.TaskId.in_(task_ids),
+            self.table.c.Env == env
+        )
+        count_stmt = (
+            select(self.table.c.TaskId, func.count())
+            .where(*matches)
+            .group_by(self.table.c.TaskId)
         )
+        update_stmt = update(self.table).where(*matches).values(Status=status)
 
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(stmt)
-                conn.commit()
+            # Per-ID counts and the UPDATE share one transaction, so they describe the same rows
+            with self.engine.begin() as conn:
+                for task_id, count in conn.execute(count_stmt):
+                    results[str(task_id)] = count
+                conn.execute(update_stmt)
+        except SQLAlchemyError as e:
+            hitlLogger.error(f"❌ Error updating task status to '{status}' for TaskIds {task_ids}: {e}")
+            return {task_id: 0 for task_id in task_ids}
 
-                updated = result.rowcount
-                if updated > 0:
-                    hitlLogger.info(f"✅  {updated} row(s) updated to 'resolved' for TaskId = {task_id}")
-                else:
-                    hitlLogger.info(f"⚠️ No rows updated for TaskId = {task_id}")
+        for task_id, updated in results.items():
+            if updated > 0:
+                hitlLogger.info(f"✅  {updated} row(s) updated to '{status}' for TaskId = {task_id}")
+            else:
+                hitlLogger.info(f"⚠️ No rows updated for TaskId = {task_id}")
+        return results
 
-                return updated
-        except SQLAlchemyError as e:
-            hitlLogger.error(f"❌ Error updating task status: {e}")
-            return 0
+    def update_task_status_to_resolved(self, test_user, task_id: str) -> int:
+        return self.update_status_bulk([task_id], "Resolved", test_user.test_env)[str(task_id)]
 
     def get_tasks_to_resolve(self, test_meta, test_user, no_of_tasks_to_resolve) -> List[TaskRow]:
         stmt = (
@@ -96,25 +114,4 @@ class TaskIdMapperDAO:
             return []
 
     def update_task_status_to_in_progress(self, test_user, task_id: str) -> int:
-        stmt = (
-            update(self.table)
-            .where(self.table.c.TaskId == task_id)
-            .where(self.table.c.Env == test_user.test_env)
-            .values(Status="In Progress")
-        )
-
-        try:
-            with self.engine.connect() as conn:
-                result = conn.execute(stmt)
-                conn.commit()
-
-                updated = result.rowcount
-                if updated > 0:
-                    hitlLogger.info(f"✅  {updated} row(s) updated to 'In Progress' for TaskId = {task_id}")
-                else:
-                    hitlLogger.info(f"⚠️ No rows updated for TaskId = {task_id}")
-
-                return updated
-        except SQLAlchemyError as e:
-            hitlLogger.error(f"❌ Error updating task status to In Progress: {e}")
-            return 0
+        return self.update_status_bulk([task_id], "In Progress", test_user.test_env)[str(task_id)]
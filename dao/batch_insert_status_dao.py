@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from db_models.hitl_app_db_models import DM_QAProduct_Product, TM_Exception_Log
+
+
+@dataclass
+class BatchInsertStatus:
+    transaction_id: int
+    completed_count: int = 0
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    error_count: int = 0
+
+    @property
+    def duration_ms(self) -> Optional[int]:
+        if not self.start_time or not self.end_time:
+            return None
+        return int((self.end_time - self.start_time).total_seconds() * 1000)
+
+    @property
+    def status(self) -> str:
+        return "Failed" if self.error_count > 0 or self.duration_ms is None else "Completed"
+
+
+def get_batch_insert_status(app_db_session: Session, transaction_ids: Iterable) -> Dict[int, BatchInsertStatus]:
+    """
+    Product count, first/last Created_Date and TM_Exception_Log count for any
+    number of batches in a single statement: two grouped CTEs full-outer-joined
+    on the transaction ID. Every requested ID is present in the result.
+    """
+    transaction_ids = [int(transaction_id) for transaction_id in transaction_ids]
+    results = {transaction_id: BatchInsertStatus(transaction_id) for transaction_id in transaction_ids}
+    if not transaction_ids:
+        return results
+
+    products = (
+        select(
+            DM_QAProduct_Product.Transaction_ID.label("transaction_id"),
+            func.count().label("completed_count"),
+            func.min(DM_QAProduct_Product.Created_Date).label("start_time"),
+            func.max(DM_QAProduct_Product.Created_Date).label("end_time")
+        )
+        .where(DM_QAProduct_Product.Transaction_ID.in_(transaction_ids))
+        .group_by(DM_QAProduct_Product.Transaction_ID)
+        .cte("batch_products")
+    )
+    errors = (
+        select(
+            TM_Exception_Log.Key.label("transaction_id"),
+            func.count().label("error_count")
+        )
+        .where(TM_Exception_Log.Key.in_(transaction_ids))
+        .group_by(TM_Exception_Log.Key)
+        .cte("batch_errors")
+    )
+    stmt = (
+        select(
+            func.coalesce(products.c.transaction_id, errors.c.transaction_id).label("transaction_id"),
+            func.coalesce(products.c.completed_count, 0).label("completed_count"),
+            products.c.start_time,
+            products.c.end_time,
+            func.coalesce(errors.c.error_count, 0).label("error_count")
+        )
+        .select_from(products.join(errors, products.c.transaction_id == errors.c.transaction_id, full=True))
+    )
+
+    for row in app_db_session.execute(stmt):
+        results[int(row.transaction_id)] = BatchInsertStatus(
+            transaction_id=int(row.transaction_id),
+            completed_count=row.completed_count,
+            start_time=row.start_time,
+            end_time=row.end_time,
+            error_count=row.error_count
+        )
+    return results
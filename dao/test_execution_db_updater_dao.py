@@ -1,20 +1,66 @@
+import os
+import time
 from datetime import datetime
 
+from sqlalchemy import insert
+
 from db_engine.test_automation_engine import get_test_db_session
+from dao.test_telemetry_writer import get_test_telemetry_writer
 from db_models.ui_test_db_models import TestCase, TestExecution, TestStep
 
 
 class DBReporter:
-    def __init__(self):
-        self.session = get_test_db_session()
+    def __init__(self, buffered: bool = None, flush_size: int = None, flush_interval: float = None,
+                 write_behind: bool = None):
+        self._session = None
         self.execution = None
         self._execution_ended = False
+        # Write-behind mode hands every row to the background telemetry writer instead of this session
+        self.write_behind = (os.getenv("DB_TELEMETRY_ASYNC", "true").lower() == "true"
+                             if write_behind is None else write_behind)
+        self.execution_token = None
+        # Buffered mode queues steps in memory and writes them with one executemany INSERT
+        self.buffered = os.getenv("DB_REPORTER_BUFFERED", "true").lower() == "true" if buffered is None else buffered
+        self.flush_size = flush_size or int(os.getenv("DB_REPORTER_FLUSH_SIZE", "50"))
+        self.flush_interval = flush_interval or float(os.getenv("DB_REPORTER_FLUSH_SECONDS", "30"))
+        self._pending_steps = []
+        self._last_flush = time.monotonic()
+
+    @property
+    def session(self):
+        # Only the synchronous path writes through this session; write-behind mode never opens one
+        if self._session is None:
+            self._session = get_test_db_session()
+        return self._session
 
     def start_test_execution(
             self, test_name, description, env, browser,
             domain=None, entity=None, created_by=None, from_pipeline=None,
             ado_plan_id=None, ado_suite_id=None, ado_case_id=None, build_definition_id=None
     ):
+        if self.write_behind:
+            self.execution_token = get_test_telemetry_writer().start_execution(
+                test_case={
+                    "Test_Case_Name": test_name,
+                    "Description": description,
+                    "Domain": domain,
+                    "Entity": entity,
+                    "Created_by": created_by,
+                    "Ado_Plan_Id": ado_plan_id,
+                    "Ado_Suite_Id": ado_suite_id,
+                    "Ado_Case_Id": ado_case_id,
+                    "Build_Definition_Id": build_definition_id
+                },
+                execution={
+                    "Outcome": 'RUNNING',
+                    "Start_Time": datetime.now(),
+                    "Environment": env,
+                    "Browser": browser,
+                    "From_Pipeline": from_pipeline
+                }
+            )
+            return
+
         test_case = self.session.query(TestCase).filter_by(Test_Case_Name=test_name).first()
         if not test_case:
             test_case = TestCase(
@@ -55,7 +101,16 @@ class DBReporter:
         self.session.commit()
 
     def end_test_execution(self, status, error_message=None):
-        if self.execution and not self._execution_ended:
+        if self.execution_token and not self._execution_ended:
+            get_test_telemetry_writer().end_execution(self.execution_token, {
+                "Outcome": status,
+                "End_Time": datetime.now(),
+                "Error_Message": error_message
+            })
+            self._execution_ended = True
+        elif self.execution and not self._execution_ended:
+            # Pending steps and the final outcome go out in the same transaction
+            self.flush_steps(commit=False)
             self.execution.Outcome = status
             self.execution.End_Time = datetime.now()
             self.execution.Error_Message = error_message
@@ -68,9 +123,28 @@ class DBReporter:
             print("⚠️ No execution started. Cannot end test execution.")
 
     def add_step(self, step_name, status, details=None):
+        if self.execution_token:
+            get_test_telemetry_writer().add_step(self.execution_token, {
+                "Step_Desc": step_name,
+                "Outcome": status,
+                "Timestamp": datetime.now(),  # ✅ Local time
+                "Details": details
+            })
+            return
         if not self.execution:
             print("⚠️ Cannot add step — test execution not started.")
             return
+        if self.buffered:
+            self._pending_steps.append({
+                "Execution_Id": self.execution.ID,
+                "Step_Desc": step_name,
+                "Outcome": status,
+                "Timestamp": datetime.now(),  # ✅ Local time
+                "Details": details
+            })
+            if len(self._pending_steps) >= self.flush_size or time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush_steps()
+            return
         step = TestStep(
             Execution_Id=self.execution.ID,
             Step_Desc=step_name,
@@ -80,3 +154,31 @@ class DBReporter:
         )
         self.session.add(step)
         self.session.commit()
+
+    def flush_steps(self, commit: bool = True):
+        self._last_flush = time.monotonic()
+        if not self._pending_steps:
+            return
+        steps, self._pending_steps = self._pending_steps, []
+        try:
+            self.session.execute(insert(TestStep), steps)
+            if commit:
+                self.session.commit()
+        except Exception:
+            self.session.rollback()
+            self._pending_steps = steps + self._pending_steps
+            raise
+
+    def close(self):
+        """
+        Flushes buffered steps and releases the session; safe to call more
+        than once and from a finalizer after the test crashed.
+        """
+        try:
+            if self._pending_steps:
+                self.flush_steps()
+        except Exception as e:
+            print(f"⚠️ Could not flush {len(self._pending_steps)} buffered test step(s): {e}")
+        finally:
+            if self._session is not None:
+                self._session.close()
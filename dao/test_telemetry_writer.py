@@ -0,0 +1,212 @@
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+
+from sqlalchemy import insert
+
+from db_engine.test_automation_engine import get_test_db_session
+from db_models.ui_test_db_models import TestCase, TestExecution, TestStep
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+
+class TestTelemetryWriter:
+    """
+    Write-behind pipeline for UI_Test_Cases / UI_Test_Executions / UI_Test_Steps.
+    DBReporter enqueues start/step/end events and returns immediately; one
+    background thread with its own session drains the queue in batches and
+    writes each batch in a single transaction. Queue depth and the lag between
+    enqueue and commit are tracked and reported by log_stats().
+    """
+
+    def __init__(self, batch_size: int = 200, max_queue_size: int = 10000, poll_seconds: float = 0.5):
+        self.batch_size = batch_size
+        self.poll_seconds = poll_seconds
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._tokens = itertools.count(1)
+        self._execution_ids = {}
+        self._test_case_ids = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self.written_events = 0
+        self.failed_events = 0
+        self.batches = 0
+        self.max_depth = 0
+        self.max_lag_ms = 0.0
+        self.total_lag_ms = 0.0
+
+    def start_execution(self, test_case: dict, execution: dict) -> int:
+        token = next(self._tokens)
+        self._put("start", token, {"test_case": test_case, "execution": execution})
+        return token
+
+    def add_step(self, token: int, step: dict):
+        self._put("step", token, step)
+
+    def end_execution(self, token: int, outcome: dict):
+        self._put("end", token, outcome)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth(),
+                "max_queue_depth": self.max_depth,
+                "written_events": self.written_events,
+                "failed_events": self.failed_events,
+                "batches": self.batches,
+                "avg_lag_ms": self.total_lag_ms / self.written_events if self.written_events else 0.0,
+                "max_lag_ms": self.max_lag_ms
+            }
+
+    def log_stats(self):
+        stats = self.stats()
+        if not stats["written_events"] and not stats["failed_events"]:
+            return
+        hitlLogger.info(
+            f"📊 Test telemetry: written={stats['written_events']} in {stats['batches']} batch(es), "
+            f"failed={stats['failed_events']}, queue_depth={stats['queue_depth']} (peak {stats['max_queue_depth']}), "
+            f"lag avg={stats['avg_lag_ms']:.0f}ms max={stats['max_lag_ms']:.0f}ms")
+
+    def drain(self, timeout: float = 60):
+        """Blocks until every queued event was written (or timeout) and logs the pipeline stats."""
+        if self._thread:
+            deadline = time.monotonic() + timeout
+            while self._queue.unfinished_tasks and time.monotonic() < deadline:
+                time.sleep(0.05)
+            if self._queue.unfinished_tasks:
+                hitlLogger.warning(f"⚠️ {self._queue.unfinished_tasks} telemetry event(s) still pending after {timeout}s")
+        self.log_stats()
+
+    def _put(self, kind: str, token: int, payload: dict):
+        self._start_thread()
+        self._queue.put((kind, token, payload, time.monotonic()))
+        depth = self._queue.qsize()
+        if depth > self.max_depth:
+            with self._lock:
+                self.max_depth = max(self.max_depth, depth)
+
+    def _start_thread(self):
+        if self._thread:
+            return
+        with self._lock:
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, name="test-telemetry-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        session = None
+        while True:
+            try:
+                events = [self._queue.get(timeout=self.poll_seconds)]
+            except queue.Empty:
+                continue
+            while len(events) < self.batch_size:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                session = session or get_test_db_session()
+                self._write_batch(session, events)
+            except Exception as e:
+                # The session may be unusable (e.g. dropped connection, failed rollback); never reuse it
+                if session is not None:
+                    try:
+                        session.close()
+                    except Exception:
+                        pass
+                    session = None
+                with self._lock:
+                    self.failed_events += len(events)
+                hitlLogger.warning(f"⚠️ Dropped {len(events)} telemetry event(s): {e}")
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+
+    def _write_batch(self, session, events: list):
+        started_tokens = []
+        orphaned = []
+        try:
+            steps = []
+            for event in events:
+                kind, token, payload, _ = event
+                if kind == "start":
+                    self._execution_ids[token] = self._write_start(session, payload)
+                    started_tokens.append(token)
+                    continue
+                execution_id = self._execution_ids.get(token)
+                if execution_id is None:
+                    # Its start event was dropped by an earlier failed batch
+                    orphaned.append(event)
+                    continue
+                if kind == "step":
+                    steps.append({**payload, "Execution_Id": execution_id})
+                else:
+                    session.query(TestExecution).filter_by(ID=execution_id).update(payload)
+                    self._execution_ids.pop(token, None)
+            if steps:
+                session.execute(insert(TestStep), steps)
+            session.commit()
+        except Exception:
+            for token in started_tokens:
+                self._execution_ids.pop(token, None)
+            # IDs of test cases created in this batch were rolled back too
+            self._test_case_ids.clear()
+            session.rollback()
+            raise
+
+        now = time.monotonic()
+        with self._lock:
+            self.batches += 1
+            self.failed_events += len(orphaned)
+            for *_, queued_at in [event for event in events if event not in orphaned]:
+                lag_ms = (now - queued_at) * 1000
+                self.written_events += 1
+                self.total_lag_ms += lag_ms
+                self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    def _write_start(self, session, payload: dict) -> int:
+        fields = payload["test_case"]
+        name = fields["Test_Case_Name"]
+        test_case_id = self._test_case_ids.get(name)
+        if test_case_id is None:
+            test_case = session.query(TestCase).filter_by(Test_Case_Name=name).first()
+            if not test_case:
+                test_case = TestCase(**fields)
+                session.add(test_case)
+                session.flush()
+            test_case_id = test_case.ID
+            self._test_case_ids[name] = test_case_id
+        # Keep the test case metadata current, as the synchronous path does
+        session.query(TestCase).filter_by(ID=test_case_id).update(fields)
+
+        execution = TestExecution(Test_Case_Id=test_case_id, **payload["execution"])
+        session.add(execution)
+        session.flush()
+        return execution.ID
+
+
+_telemetry_writer = None
+_telemetry_writer_lock = threading.Lock()
+
+
+def get_test_telemetry_writer() -> TestTelemetryWriter:
+    global _telemetry_writer
+    with _telemetry_writer_lock:
+        if _telemetry_writer is None:
+            _telemetry_writer = TestTelemetryWriter(
+                batch_size=int(os.getenv("DB_TELEMETRY_BATCH_SIZE", "200")),
+                max_queue_size=int(os.getenv("DB_TELEMETRY_QUEUE_SIZE", "10000"))
+            )
+        return _telemetry_writer
+
+
+def drain_test_telemetry_writer():
+    if _telemetry_writer is not None:
+        _telemetry_writer.drain()
@@ -0,0 +1,82 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+
+from sqlalchemy import MetaData, text
+from sqlalchemy.engine import Engine
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+# Reflected tables shared by every DAO in the process, keyed by (server, schema, table)
+_tables = {}
+_tables_lock = threading.Lock()
+
+
+def get_reflected_table(engine: Engine, table_name: str, schema: str = "dbo"):
+    """
+    Returns the reflected Table, reflecting it at most once per process.
+    When DB_METADATA_CACHE_DIR is set the reflected MetaData is also pickled
+    to disk, keyed by server and a fingerprint of the table's last DDL change,
+    so later runs skip reflection until the table definition changes.
+    """
+    server_key = hashlib.sha256(str(engine.url).encode("utf-8")).hexdigest()[:16]
+    key = (server_key, schema, table_name)
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = _load_table(engine, server_key, table_name, schema)
+            _tables[key] = table
+        return table
+
+
+def _load_table(engine: Engine, server_key: str, table_name: str, schema: str):
+    full_name = f"{schema}.{table_name}"
+    cache_dir = os.getenv("DB_METADATA_CACHE_DIR")
+    cache_path = None
+
+    if cache_dir:
+        fingerprint = _schema_fingerprint(engine, full_name)
+        if fingerprint:
+            digest = hashlib.sha256(f"{server_key}|{full_name}|{fingerprint}".encode("utf-8")).hexdigest()
+            cache_path = os.path.join(cache_dir, f"{table_name}_{digest[:16]}.pickle")
+            try:
+                with open(cache_path, "rb") as f:
+                    metadata = pickle.load(f)
+                hitlLogger.info(f"✅  Table loaded from metadata cache: {full_name}")
+                return metadata.tables[full_name]
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                hitlLogger.warning(f"⚠️ Ignoring unreadable metadata cache {cache_path}: {e}")
+
+    metadata = MetaData()
+    metadata.reflect(bind=engine, schema=schema, only=[table_name])
+    table = metadata.tables[full_name]
+    hitlLogger.info(f"✅  Table loaded: {full_name}")
+
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(metadata, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            hitlLogger.warning(f"⚠️ Could not write metadata cache {cache_path}: {e}")
+    return table
+
+
+def _schema_fingerprint(engine: Engine, full_name: str):
+    # A single cheap catalog lookup; changes whenever the table's DDL changes
+    try:
+        with engine.connect() as conn:
+            modified = conn.execute(
+                text("SELECT modify_date FROM sys.objects WHERE object_id = OBJECT_ID(:name)"),
+                {"name": full_name}
+            ).scalar()
+        return modified.isoformat() if modified else None
+    except Exception as e:
+        hitlLogger.warning(f"⚠️ Could not fingerprint {full_name} for the metadata cache: {e}")
+        return None
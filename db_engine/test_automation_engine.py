@@ -1,14 +1,114 @@
 import logging
 import os
+import threading
+import time
 import urllib.parse
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 hitlLogger = logging.getLogger("HitlLogger")
 
+# One pooled engine per (database, env) for the whole process; see get_cached_engine()
+_engines = {}
+_session_factories = {}
+_pool_metrics = {}
+_engines_lock = threading.Lock()
+
+
+def _create_pooled_engine(url: str):
+    return create_engine(
+        url,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        # Azure SQL drops idle connections after ~30 min; recycle before that and ping on checkout
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1200")),
+        pool_pre_ping=True,
+        # Send executemany batches (bulk step inserts) as one ODBC array round trip
+        fast_executemany=True
+    )
+
+
+def _track_pool_metrics(key, engine):
+    metrics = {"connects": 0, "checkouts": 0, "in_use": 0, "peak_in_use": 0, "total_checkout_ms": 0.0}
+    _pool_metrics[key] = metrics
+    checkout_started = {}
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics["connects"] += 1
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        with _engines_lock:
+            metrics["checkouts"] += 1
+            metrics["in_use"] += 1
+            metrics["peak_in_use"] = max(metrics["peak_in_use"], metrics["in_use"])
+        checkout_started[id(connection_record)] = time.perf_counter()
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        started = checkout_started.pop(id(connection_record), None)
+        with _engines_lock:
+            metrics["in_use"] = max(metrics["in_use"] - 1, 0)
+            if started is not None:
+                metrics["total_checkout_ms"] += (time.perf_counter() - started) * 1000
+
+
+def get_cached_engine(database: str, env: str, url_factory):
+    """
+    Returns the process-wide engine for (database, env), creating it with
+    url_factory() on first use. Callers share one connection pool, so they
+    must not dispose the returned engine; dispose_all_engines() does that.
+    """
+    key = (database, env)
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is not None:
+            return engine
+        engine = _create_pooled_engine(url_factory())
+        _track_pool_metrics(key, engine)
+        _engines[key] = engine
+    hitlLogger.info(f"🔌 Created pooled DB engine for {database} ({env})")
+    return engine
+
+
+def get_cached_session_factory(engine):
+    with _engines_lock:
+        factory = _session_factories.get(id(engine))
+        if factory is None:
+            factory = sessionmaker(bind=engine)
+            _session_factories[id(engine)] = factory
+        return factory
+
+
+def log_engine_pool_metrics():
+    for (database, env), engine in list(_engines.items()):
+        metrics = _pool_metrics.get((database, env), {})
+        checkouts = metrics.get("checkouts", 0)
+        avg_ms = metrics.get("total_checkout_ms", 0.0) / checkouts if checkouts else 0
+        hitlLogger.info(
+            f"📊 DB pool {database} ({env}): connections={metrics.get('connects', 0)}, checkouts={checkouts}, "
+            f"peak_in_use={metrics.get('peak_in_use', 0)}, avg_held={avg_ms:.0f}ms, {engine.pool.status()}")
+
+
+def dispose_all_engines():
+    log_engine_pool_metrics()
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _session_factories.clear()
+        _pool_metrics.clear()
+    for engine in engines:
+        engine.dispose()
+
 
 def get_test_db_engine():
+    return get_cached_engine("HITLDB", "dev", _build_test_db_url)
+
+
+def _build_test_db_url():
     server = 'vzn-eastus2-hitl-task-manager-dev-sql-01.database.windows.net'
     database = 'HITLDB'
 
@@ -28,10 +128,14 @@ def get_test_db_engine():
         f'PWD={sql_password};'
     )
 
-    return create_engine(f'mssql+pyodbc:///?odbc_connect={params}')
+    return f'mssql+pyodbc:///?odbc_connect={params}'
 
 
 def get_app_db_engine(test_user):
+    return get_cached_engine("HITLDB-App", test_user.test_env, lambda: _build_app_db_url(test_user))
+
+
+def _build_app_db_url(test_user):
     server = f'vzn-eastus2-hitl-task-manager-{test_user.test_env}-sql-01.database.windows.net'
     database = 'HITLDB'
 
@@ -51,16 +155,14 @@ def get_app_db_engine(test_user):
         f'PWD={sql_password};'
     )
     # hitlLogger.info(f"params= {params}")
-    return create_engine(f'mssql+pyodbc:///?odbc_connect={params}')
+    return f'mssql+pyodbc:///?odbc_connect={params}'
 
 
 def get_app_db_session(test_user):
-    engine = get_app_db_engine(test_user)
-    Session = sessionmaker(bind=engine)
+    Session = get_cached_session_factory(get_app_db_engine(test_user))
     return Session()
 
 
 def get_test_db_session():
-    engine = get_test_db_engine()
-    Session = sessionmaker(bind=engine)
+    Session = get_cached_session_factory(get_test_db_engine())
     return Session()
@@ -0,0 +1,142 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from playwright.sync_api import Locator, Page, expect
+
+from utils.generic.highlighter import highlight
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+# demo  - flash every element and pause so a viewer can follow (previous behaviour)
+# ci    - no DOM mutation and no pauses, only action timing is logged
+# trace - no DOM mutation; each action is labelled as a group in the Playwright trace that
+#         the conftest context fixture records and attaches to the Allure report
+HIGHLIGHT_MODES = ("demo", "ci", "trace")
+
+
+def get_highlight_mode() -> str:
+    mode = os.getenv("HITL_HIGHLIGHT_MODE", "demo").lower()
+    if mode not in HIGHLIGHT_MODES:
+        raise ValueError(f"HITL_HIGHLIGHT_MODE must be one of {', '.join(HIGHLIGHT_MODES)}, got: {mode}")
+    return mode
+
+
+class ActionStats:
+    """Session totals of action time and the part of it spent highlighting."""
+
+    def __init__(self):
+        self.actions = 0
+        self.action_ms = 0.0
+        self.highlight_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, action_ms: float, highlight_ms: float):
+        with self._lock:
+            self.actions += 1
+            self.action_ms += action_ms
+            self.highlight_ms += highlight_ms
+
+    def log_stats(self):
+        if not self.actions:
+            return
+        hitlLogger.info(f"🖱️ {self.actions} UI action(s) in {get_highlight_mode()} mode: "
+                        f"{self.action_ms / 1000:.2f}s total, {self.highlight_ms / 1000:.2f}s highlighting "
+                        f"({self.highlight_ms / self.actions:.0f}ms per action)")
+
+
+_action_stats = ActionStats()
+
+
+def get_action_stats() -> ActionStats:
+    return _action_stats
+
+
+class LoggerPage:
+    """
+    Wraps page interactions so every click/fill is logged with its description
+    and timing. How (and whether) the target is highlighted depends on the run
+    mode, see HIGHLIGHT_MODES; the mode comes from HITL_HIGHLIGHT_MODE or the
+    --highlight-mode pytest option.
+    """
+
+    def __init__(self, page: Page, mode: str = None):
+        self.page = page
+        self.mode = mode or get_highlight_mode()
+        self.demo_pause_ms = int(os.getenv("HITL_DEMO_PAUSE_MS", "500"))
+
+    def log(self, action: str, message: str):
+        hitlLogger.info(f"🔹 [{action}] {message}")
+
+    def info(self, message: str):
+        hitlLogger.info(f"ℹ️ {message}")
+
+    def click(self, locator: Locator, description: str):
+        self._perform("Click", locator, description, lambda: locator.click())
+
+    def click_first(self, locator: Locator, description: str):
+        first = locator.first
+        self._perform("Click", first, description, lambda: first.click())
+
+    def fill(self, locator: Locator, value: str, description: str):
+        # The value is not logged, descriptions like "Password Field" are enough
+        self._perform("Fill", locator, description, lambda: locator.fill(value))
+
+    def check(self, locator: Locator, description: str):
+        self._perform("Check", locator, description, lambda: locator.check())
+
+    def send_key_strokes(self, locator: Locator, text: str, description: str, delay: int = 100):
+        self._perform("Type", locator, description, lambda: locator.press_sequentially(text, delay=delay))
+
+    def wait_for_visible(self, locator: Locator, description: str, timeout: int = 30000):
+        self._perform("Wait visible", locator, description,
+                      lambda: locator.wait_for(state="visible", timeout=timeout), highlight_first=False)
+
+    def assert_contains_text(self, locator: Locator, expected: str, description: str, timeout: int = 10000):
+        self._perform("Assert text", locator, description,
+                      lambda: expect(locator).to_contain_text(expected, timeout=timeout), highlight_first=False)
+
+    def highlight_only(self, locator: Locator, description: str):
+        # Still proves the element is there when nothing is drawn
+        self._perform("Highlight", locator, description, lambda: locator.wait_for(state="visible", timeout=60000))
+
+    def _perform(self, action: str, locator: Locator, description: str, perform, highlight_first: bool = True):
+        start = time.perf_counter()
+        highlight_ms = 0.0
+        with self._trace_group(f"{action}: {description}"):
+            if highlight_first:
+                highlight_ms = self._highlight(locator)
+            perform()
+            if not highlight_first:
+                highlight_ms = self._highlight(locator)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _action_stats.record(elapsed_ms, highlight_ms)
+        hitlLogger.info(f"🖱️ {action} → {description} ({elapsed_ms:.0f}ms)")
+
+    def _highlight(self, locator: Locator) -> float:
+        if self.mode != "demo":
+            return 0.0
+        start = time.perf_counter()
+        highlight(locator)
+        if self.demo_pause_ms:
+            self.page.wait_for_timeout(self.demo_pause_ms)
+        return (time.perf_counter() - start) * 1000
+
+    @contextmanager
+    def _trace_group(self, name: str):
+        if self.mode != "trace":
+            yield
+            return
+        tracing = self.page.context.tracing
+        try:
+            tracing.group(name)
+        except Exception:
+            # Tracing not started for this context, nothing to label
+            yield
+            return
+        try:
+            yield
+        finally:
+            tracing.group_end()
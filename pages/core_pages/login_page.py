@@ -86,3 +86,17 @@ class LoginPage:
                 step_logger.fail_step("Validate login", "Dashboard is visible", str(exception))
             handle_exception(self, exception, reporter, method_name)
             raise
+
+    def is_session_authenticated(self, timeout: int = 30000) -> bool:
+        """
+        After navigate(), wait for either the dashboard or the SSO email prompt
+        and report whether an injected session was accepted.
+        """
+        welcome_locator = self.page.get_by_text("Welcome to Provider Copilot")
+        email_locator = self.page.get_by_role("textbox", name="Email")
+        try:
+            welcome_locator.or_(email_locator).first.wait_for(state="visible", timeout=timeout)
+        except Exception as exception:
+            self.log.log("session_check", f"Neither dashboard nor login prompt became visible: {exception}")
+            return False
+        return welcome_locator.is_visible()
@@ -2,6 +2,8 @@
 
 from playwright.sync_api import Page
 
+from utils.browser.grid_snapshot import take_grid_snapshot
+
 class HistoryPage:
     def __init__(self, page: Page):
         self.page = page
@@ -10,12 +12,12 @@ class HistoryPage:
         return self.page.locator("div.ag-center-cols-container div.ag-row")
 
     def get_row_values(self, row_index: int, fields: list):
-        row = self.get_audit_rows().nth(row_index)
-        values = {}
-        for field in fields:
-            cell = row.locator(f'div.ag-cell[col-id="{field}"]')
-            values[field] = cell.inner_text()
-        return values
+        # One snapshot of the grid instead of an inner_text() round trip per field
+        rows = take_grid_snapshot(self.page).rows
+        if row_index >= len(rows):
+            raise IndexError(f"Audit row {row_index} not rendered (found {len(rows)} row(s))")
+        cells = rows[row_index].cells
+        return {field: cells[field] for field in fields if field in cells}
 
     def click_back(self):
         self.page.get_by_role("button", name="Back").click()
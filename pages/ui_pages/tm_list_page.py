@@ -2,7 +2,7 @@ import inspect
 import logging
 import re
 from datetime import datetime
-from playwright.sync_api import Page
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 
 from dao.api_ui_taskId_mapper_dao import TaskIdMapperDAO
 from dao.test_execution_db_updater_dao import DBReporter
@@ -11,6 +11,9 @@ from lib.hitl_logger import LoggerPage
 from pages.core_pages.home_page import HomePage
 from pages.ui_pages.tm_history_page import HistoryPage
 from utils.ado.ado_step_logger import StepLogger
+from utils.browser.grid_snapshot import take_grid_snapshot
+from utils.browser.waits import grid_signature, wait_for_grid_settled, wait_for_overlay_closed, \
+    wait_for_row_count
 from utils.generic.get_readable_method_name import get_method_name
 from utils.generic.post_test_actions_handler import save_success, handle_exception
 
@@ -301,9 +304,10 @@ class TaskManagerListPage:
 
             self.log.click(back_btn, "Back to List")
 
-            # Step 5: Mark all tasks as Resolved
+            # Step 5: Mark all tasks as Resolved in one UPDATE
+            updated_by_id = self.dao.update_status_bulk(task_ids, "Resolved", test_user.test_env)
             for task_id in task_ids:
-                updated = self.dao.update_task_status_to_resolved(test_user, task_id)
+                updated = updated_by_id[task_id]
                 if updated == 0:
                     hitlLogger.warning(f"⚠️ Task ID {task_id} was NOT updated to 'Resolved'. Check Env/TaskId.")
                     assert False, f"Task ID {task_id} not updated to 'Resolved'"
@@ -370,36 +374,22 @@ class TaskManagerListPage:
 
     def get_displayed_columns(self):
         headers = self.page.locator(".ag-header-cell")
-        columns = []
-        count = headers.count()
-        for i in range(count):
-            header = headers.nth(i)
-            label = header.inner_text().strip()
-            field_attr = header.get_attribute("col-id")
-            columns.append({
-                "label": label,
-                "field": field_attr,
-                "locator": header  # pass locator for highlighting
-            })
-        return columns
+        return [
+            {
+                "label": column.label,
+                "field": column.field,
+                "locator": headers.nth(column.index)  # pass locator for highlighting
+            }
+            for column in take_grid_snapshot(self.page).columns
+        ]
 
     def get_sample_data(self):
-        first_row = self.page.locator(".ag-center-cols-container .ag-row").first
-        cells = (first_row.locator
-
-                 (".ag-cell"))
-        data = {}
-        count = cells.count()
-        for i in range(count):
-            cell = cells.nth(i)
-            field = cell.get_attribute("col-id")  # adjust if needed
-            value = cell.inner_text().strip()
-            if field:
-                data[field] = value
-        return [data]
+        rows = take_grid_snapshot(self.page).rows
+        if not rows:
+            return [{}]
+        return [{field: value.strip() for field, value in rows[0].cells.items()}]
 
     def view_audit_history_log(self, test_meta, test_user, reporter: DBReporter, step_logger: StepLogger):
-        import time
         method_name = inspect.currentframe().f_code.co_name
         hitlLogger.info("📌 Entered view_audit_history_log()")
 
@@ -426,18 +416,10 @@ class TaskManagerListPage:
                 expected_labels = fields
 
                 self.page.locator("div.ag-header-cell").first.wait_for(state="visible", timeout=5000)
-                actual_headers = self.page.locator("div.ag-header-cell")
-                hitlLogger.info(f"🧠 Header count: {actual_headers.count()}")
-
-                actual = []
-                for i in range(actual_headers.count()):
-                    cell = actual_headers.nth(i)
-                    label = cell.locator("span.ag-header-cell-text").inner_text()
-                    hitlLogger.info(f"🔹 Header {i}: {label}")
-                    actual.append({
-                        "label": label.strip(),
-                        "locator": cell
-                    })
+                actual = self.get_displayed_columns()
+                hitlLogger.info(f"🧠 Header count: {len(actual)}")
+                for i, col in enumerate(actual):
+                    hitlLogger.info(f"🔹 Header {i}: {col['label']}")
 
                 for expected_label in expected_labels:
                     for col in actual:
@@ -458,14 +440,10 @@ class TaskManagerListPage:
 
             # 📊 Wait for audit rows
             history_page = HistoryPage(self.page)
-            max_retries = 10
-            for i in range(max_retries):
-                rows = history_page.get_audit_rows()
-                if rows.count() >= 2:
-                    break
-                hitlLogger.info(f"🔁 Attempt {i + 1}: Waiting for audit rows...")
-                time.sleep(1)
-            else:
+            try:
+                wait_for_row_count(self.page, "div.ag-center-cols-container div.ag-row", minimum=2,
+                                   label="audit rows")
+            except PlaywrightTimeoutError:
                 raise AssertionError("❌ Expected 2 audit log entries")
 
             # ✅ Get row values
@@ -647,6 +625,7 @@ class TaskManagerListPage:
 
             # 🆕 Close city dropdown (to remove overlay)
             self.page.keyboard.press("Escape")
+            wait_for_overlay_closed(self.page)
 
             # Look for the error message below the City Dropdown
             error_locator = self.page.locator("text=is a required property").nth(0)
@@ -970,9 +949,12 @@ class TaskManagerListPage:
             step_logger.add_step("Autocomplete - Boston", "Dropdown shows expected results for 'Boston'")
 
             # Step 4: Clear and type "Janet", then validate first column only
+            boston_options = grid_signature(self.page, "mat-option[role='option']")
             person_field.fill("")
             person_field.type("Janet", delay=100)
-            self.page.wait_for_timeout(1000)
+            # Must differ from the Boston list, otherwise stale options could pass as settled
+            wait_for_grid_settled(self.page, "mat-option[role='option']", changed_from=boston_options,
+                                  quiet_ms=300, label="autocomplete options")
 
             dropdown_locator = self.page.locator("mat-option[role='option']")
             dropdown_locator.first.wait_for(timeout=5000)
@@ -1173,9 +1155,10 @@ class TaskManagerListPage:
 
             self.page.get_by_role("button", name="Take Action").click()
 
-            # Step 7: Mark all tasks as Resolved
+            # Step 7: Mark all tasks as Resolved in one UPDATE
+            updated_by_id = self.dao.update_status_bulk(task_ids, "Resolved", test_user.test_env)
             for task_id in task_ids:
-                updated = self.dao.update_task_status_to_resolved(test_user, task_id)
+                updated = updated_by_id[task_id]
                 if updated == 0:
                     hitlLogger.warning(f"⚠️ Task ID {task_id} was NOT updated to 'Resolved'. Check Env/TaskId.")
                     assert False, f"Task ID {task_id} not updated to 'Resolved'"
@@ -1247,8 +1230,9 @@ class TaskManagerListPage:
             rows = self.page.locator(".ag-center-cols-container .ag-row")
             assert rows.count() <= 20, f"Expected ≤20 rows, got {rows.count()}"
 
+            first_page = grid_signature(self.page)
             self.page.get_by_role("button", name="chevron_right").click()
-            self.page.wait_for_timeout(1000)
+            wait_for_grid_settled(self.page, changed_from=first_page, label="next page")
 
             rows_next = self.page.locator(".ag-center-cols-container .ag-row")
             assert rows_next.count() <= 20, f"Expected ≤20 rows on next page, got {rows_next.count()}"
@@ -1268,8 +1252,9 @@ class TaskManagerListPage:
             selected_count = self.page.locator("div.ag-center-cols-container input[type='checkbox']:checked").count()
             assert selected_count > 0, "No checkboxes selected on current page"
 
+            first_page = grid_signature(self.page)
             self.page.get_by_role("button", name="chevron_right").click()
-            self.page.wait_for_timeout(1000)
+            wait_for_grid_settled(self.page, changed_from=first_page, label="next page")
 
             next_page_selected = self.page.locator(
                 "div.ag-center-cols-container input[type='checkbox']:checked").count()
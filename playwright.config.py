@@ -9,7 +9,8 @@ def pytest_playwright_config(playwright: Playwright):
             "slow_mo": 500,  # Slow down execution for debugging
             "baseURL": "https://www.tst.0013.edge.vizientinc.com/",  # Base URL for ui_test_suite
             "screenshot": "only-on-failure",  # Capture screenshots on failure
-            "trace": "on-first-retry"  # Collect traces for debugging
+            "trace": "on-first-retry",  # Collect traces for debugging
+            "video": "retain-on-failure"  # conftest context fixture: VIDEO_RECORDING=off/on/retain-on-failure/on-first-retry
         },
         "timeout": 60000,  # Set global timeout for actions (ms)
         "retries": 3,  # Retry failing ui_test_suite
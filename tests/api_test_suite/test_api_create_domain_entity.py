@@ -1,13 +1,10 @@
 import logging
 from datetime import datetime
-from typing import Optional
 
 import pytest
 import requests
-from sqlalchemy.orm import Session
 
-from db_engine.test_automation_engine import get_test_db_engine
-from db_models.api_test_db_models import APIServiceConfig
+from dao.api_service_config_repository import get_service_config_repository
 from utils.ado.ado_decorators import ado_api_testcase
 from utils.api.payload.api_build_domain_payload import build_domain_payload
 from utils.api.payload.api_build_entity_payload import build_entity_payload
@@ -38,19 +35,7 @@ def validate_domain_creation(unique_domain_name, service_env, reporter, step_log
 
     hitlLogger.info(f"✅ Starting: {method_name}")
     try:
-        engine = get_test_db_engine()
-        with Session(engine) as session:
-            # Get config for the matching environment
-            config: Optional[APIServiceConfig] = (
-                session.query(APIServiceConfig)
-                .filter(APIServiceConfig.service_env == service_env)
-                .filter(APIServiceConfig.request_type == "adhoc")
-                .filter(APIServiceConfig.service_desc == "createDomain")
-                .first()
-            )
-
-            if not config:
-                raise ValueError(f"No service config found for env: {service_env}")
+        config = get_service_config_repository().get(service_env, "adhoc", "createDomain")
 
         hitlLogger.info(f"✅ Building payload for {method_name}")
         payload = build_domain_payload(unique_domain_name, True)
@@ -102,19 +87,7 @@ def validate_entity_creation(unique_domain_name, service_env, reporter, step_log
 
     hitlLogger.info(f"✅ Starting: {method_name}")
     try:
-        engine = get_test_db_engine()
-        with Session(engine) as session:
-            # Get config for the matching environment
-            config: Optional[APIServiceConfig] = (
-                session.query(APIServiceConfig)
-                .filter(APIServiceConfig.service_env == service_env)
-                .filter(APIServiceConfig.request_type == "adhoc")
-                .filter(APIServiceConfig.service_desc == "createEntity")
-                .first()
-            )
-
-            if not config:
-                raise ValueError(f"No service config found for env: {service_env}")
+        config = get_service_config_repository().get(service_env, "adhoc", "createEntity")
 
         hitlLogger.info(f"✅ Building payload for {method_name}")
         payload = build_entity_payload(unique_domain_name, True)
@@ -166,19 +139,7 @@ def validate_entity_disable(unique_domain_name, service_env, reporter, step_logg
 
     hitlLogger.info(f"✅ Starting: {method_name}")
     try:
-        engine = get_test_db_engine()
-        with Session(engine) as session:
-            # Get config for the matching environment
-            config: Optional[APIServiceConfig] = (
-                session.query(APIServiceConfig)
-                .filter(APIServiceConfig.service_env == service_env)
-                .filter(APIServiceConfig.request_type == "adhoc")
-                .filter(APIServiceConfig.service_desc == "createEntity")
-                .first()
-            )
-
-            if not config:
-                raise ValueError(f"No service config found for env: {service_env}")
+        config = get_service_config_repository().get(service_env, "adhoc", "createEntity")
 
         hitlLogger.info(f"✅ Building payload for {method_name}")
         payload = build_entity_payload(unique_domain_name, False)
@@ -230,19 +191,7 @@ def validate_domain_disable(unique_domain_name, service_env, reporter, step_logg
 
     hitlLogger.info(f"✅ Starting: {method_name}")
     try:
-        engine = get_test_db_engine()
-        with Session(engine) as session:
-            # Get config for the matching environment
-            config: Optional[APIServiceConfig] = (
-                session.query(APIServiceConfig)
-                .filter(APIServiceConfig.service_env == service_env)
-                .filter(APIServiceConfig.request_type == "adhoc")
-                .filter(APIServiceConfig.service_desc == "createDomain")
-                .first()
-            )
-
-            if not config:
-                raise ValueError(f"No service config found for env: {service_env}")
+        config = get_service_config_repository().get(service_env, "adhoc", "createDomain")
 
         hitlLogger.info(f"✅ Building payload for {method_name}")
         payload = build_domain_payload(unique_domain_name, False)
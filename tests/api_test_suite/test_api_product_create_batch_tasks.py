@@ -1,12 +1,12 @@
 import logging
+import os
 import time
 
 import pytest
-from sqlalchemy import func
 
+from dao.batch_insert_status_dao import get_batch_insert_status
 from db_engine.test_automation_engine import get_app_db_session, get_test_db_session
 from db_models.api_test_db_models import APIUITaskMapping
-from db_models.hitl_app_db_models import DM_QAProduct_Product, TM_Exception_Log
 from tests.core_test_suite.create_batch_product_tasks import create_batch_product_tasks
 from utils.ado.ado_decorators import ado_api_testcase
 from utils.api.api_batch_product_payload_builder import build_batch_payload
@@ -39,7 +39,7 @@ def run_batch_insert_success_case(test_user, tasks_count, reporter, request):
         hitlLogger.info("✅ Submitting full batch payload...")
         transaction_id = create_batch_product_tasks(test_user, tasks_count, payload)
 
-        _log_and_wait(transaction_id)
+        wait_for_batch_ingestion(test_user, transaction_id, request, expected_count=tasks_count)
 
         hitlLogger.info("✅ Querying batch insert results...")
         status, completed_count, error_count = query_batch_insert_status(
@@ -78,7 +78,8 @@ def run_batch_insert_missing_event_domain_case(test_user, tasks_count, reporter,
         hitlLogger.info("✅ Submitting batch insert with missing eventDomain...")
         transaction_id = create_batch_product_tasks(test_user, tasks_count, payload)
 
-        _log_and_wait(transaction_id)
+        # Nothing should be ingested, so this returns as soon as the failure is logged
+        wait_for_batch_ingestion(test_user, transaction_id, request)
 
         hitlLogger.info("✅ Querying failed batch insert results...")
         status, completed_count, error_count = query_batch_insert_status(
@@ -120,48 +121,26 @@ def query_batch_insert_status(test_user, transaction_id, reporter=None, step_log
         if step_logger:
             step_logger.add_step(method_name, f"Processing transaction ID: {transaction_id}")
 
-        tasks_batch_completed = (
-            app_db_session.query(func.count())
-            .filter(DM_QAProduct_Product.Transaction_ID == transaction_id)
-            .scalar()
-        )
-        hitlLogger.info(f"✅ Tasks Completed: {tasks_batch_completed}")
-        if step_logger:
-            step_logger.add_step(method_name, f"Tasks Completed: {tasks_batch_completed}")
-
-        result = (
-            app_db_session.query(
-                func.min(DM_QAProduct_Product.Created_Date).label("StartTime"),
-                func.max(DM_QAProduct_Product.Created_Date).label("EndTime")
-            )
-            .filter(DM_QAProduct_Product.Transaction_ID == transaction_id)
-            .one()
-        )
-        start_time = result.StartTime
-        end_time = result.EndTime
-        duration_ms = (
-            int((end_time - start_time).total_seconds() * 1000)
-            if start_time and end_time else None
-        )
+        batch = get_batch_insert_status(app_db_session, [transaction_id])[int(transaction_id)]
+        tasks_batch_completed = batch.completed_count
+        start_time = batch.start_time
+        end_time = batch.end_time
+        duration_ms = batch.duration_ms
+        batch_errors = batch.error_count
 
+        hitlLogger.info(f"✅ Tasks Completed: {tasks_batch_completed}")
         hitlLogger.info(f"✅ Start Time: {start_time}")
         hitlLogger.info(f"✅ End Time: {end_time}")
         hitlLogger.info(f"✅ Duration: {duration_ms} ms")
+        hitlLogger.info(f"✅ Errors Detected: {batch_errors}")
         if step_logger:
+            step_logger.add_step(method_name, f"Tasks Completed: {tasks_batch_completed}")
             step_logger.add_step(method_name, f"Start Time: {start_time}")
             step_logger.add_step(method_name, f"End Time: {end_time}")
             step_logger.add_step(method_name, f"Duration (ms): {duration_ms}")
-
-        batch_errors = (
-            app_db_session.query(func.count())
-            .filter(TM_Exception_Log.Key == transaction_id)
-            .scalar()
-        )
-        hitlLogger.info(f"✅ Errors Detected: {batch_errors}")
-        if step_logger:
             step_logger.add_step(method_name, f"Batch Errors: {batch_errors}")
 
-        status = "Failed" if batch_errors > 0 or duration_ms is None else "Completed"
+        status = batch.status
         hitlLogger.info(f"✅ Final Status: {status}")
         if step_logger:
             step_logger.add_step(method_name, f"Final Status: {status}")
@@ -202,6 +181,58 @@ def query_batch_insert_status(test_user, transaction_id, reporter=None, step_log
         app_db_session.close()
 
 
-def _log_and_wait(transaction_id, sleeptime=2):
-    hitlLogger.info(f"✅ Sleeping for {sleeptime} seconds before querying transaction ID: {transaction_id}")
-    time.sleep(sleeptime)
+def wait_for_batch_ingestion(test_user, transaction_id, request, expected_count=None, timeout=None,
+                             initial_delay=0.25, max_delay=4.0):
+    """
+    Polls the app DB with exponential backoff until expected_count products of
+    the batch are ingested, an error for it shows up in TM_Exception_Log, or the
+    deadline (BATCH_INGESTION_TIMEOUT_SECONDS, default 120s) passes. Records the
+    observed ingestion latency on the test as 'batch_ingestion_latency_ms'.
+    Returns "Completed", "Failed" or "TimedOut".
+    """
+    if not transaction_id:
+        return None
+
+    timeout = timeout or float(os.getenv("BATCH_INGESTION_TIMEOUT_SECONDS", "120"))
+    step_logger = request.node.steps
+    start = time.monotonic()
+    delay = initial_delay
+    polls = 0
+    app_db_session = get_app_db_session(test_user)
+    try:
+        while True:
+            polls += 1
+            completed_count, error_count = _query_ingestion_progress(app_db_session, transaction_id)
+            elapsed = time.monotonic() - start
+            if error_count > 0:
+                outcome = "Failed"
+                break
+            if expected_count and completed_count >= expected_count:
+                outcome = "Completed"
+                break
+            if elapsed + delay > timeout:
+                outcome = "TimedOut"
+                break
+            time.sleep(delay)
+            delay = min(delay * 2, max_delay)
+    finally:
+        app_db_session.close()
+
+    latency_ms = int(elapsed * 1000)
+    message = (f"Batch {transaction_id}: {outcome} after {latency_ms} ms and {polls} poll(s) "
+               f"({completed_count}/{expected_count or 0} ingested, {error_count} error(s))")
+    if outcome == "TimedOut" and expected_count:
+        hitlLogger.warning(f"⚠️ {message}")
+    else:
+        hitlLogger.info(f"⏱️ {message}")
+    if step_logger:
+        step_logger.add_step("wait_for_batch_ingestion", message)
+    request.node.user_properties.append(("batch_ingestion_latency_ms", latency_ms))
+    return outcome
+
+
+def _query_ingestion_progress(app_db_session, transaction_id):
+    batch = get_batch_insert_status(app_db_session, [transaction_id])[int(transaction_id)]
+    # End the read transaction so the next poll sees newly committed rows
+    app_db_session.rollback()
+    return batch.completed_count, batch.error_count
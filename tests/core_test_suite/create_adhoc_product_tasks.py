@@ -2,10 +2,10 @@ import os
 from datetime import datetime
 
 import requests
-from sqlalchemy.orm import Session
 
-from db_engine.test_automation_engine import get_test_db_engine
-from db_models.api_test_db_models import APIServiceConfig, APIUITaskMapping
+from dao.api_service_config_repository import get_service_config_repository
+from db_engine.test_automation_engine import get_test_db_session
+from db_models.api_test_db_models import APIUITaskMapping
 from pages.core_pages.home_page import hitlLogger
 from utils.api.api_adhoc_product_payload_builder import build_product_payload
 from utils.api.api_token_manager import get_access_token
@@ -13,12 +13,8 @@ from utils.api.api_token_manager import get_access_token
 
 def create_adhoc_product_tasks(test_user, test_meta):
     try:
-        engine = get_test_db_engine()
-        with Session(engine) as session:
-            # Fetch service config from DB
-            config = session.query(APIServiceConfig).filter(
-                APIServiceConfig.service_env == test_user.test_env
-            ).first()
+        # Service config comes from the in-memory repository
+        config = get_service_config_repository().find(test_user.test_env)
 
         # hitlLogger.info(f"API service config: {config.__dict__}")
 
@@ -84,8 +80,9 @@ def create_adhoc_product_tasks(test_user, test_meta):
                     entity=entity,
                     request_type="adhoc",
                 )
-                session.add(mapping)
-                session.commit()
+                with get_test_db_session() as session:
+                    session.add(mapping)
+                    session.commit()
                 hitlLogger.info(f"📝 Inserted into API_UI_Task_Mapping for Task ID: {task_id}")
                 return task_id
             else:
@@ -1,17 +1,39 @@
+import logging
+
 import allure
 
 from dao.test_execution_db_updater_dao import DBReporter
 from pages.core_pages.home_page import HomePage
 from pages.core_pages.login_page import LoginPage
 from utils.ado.ado_step_logger import StepLogger
+from utils.browser.auth_state_cache import get_auth_state_cache
+
+hitlLogger = logging.getLogger("HitlLogger")
 
 
 @allure.step("Login and Validate the test user")
 def login_to_dashboard(page, test_user, reporter: DBReporter, step_logger: StepLogger = None):
+    auth_cache = get_auth_state_cache()
     login = LoginPage(page, reporter)
     login.navigate(test_user.test_url, reporter, step_logger)
+
+    # Decided when the context was created; rechecking the TTL here could disagree with what was injected
+    if auth_cache.was_injected(page.context):
+        if login.is_session_authenticated():
+            hitlLogger.info(f"🍪 Reused cached login session for {test_user.user_id}")
+            login.validate_login(test_user.user_id, reporter, step_logger)
+            allure.attach(test_user.user_id, name="Logged-in User (cached session)")
+            return
+
+        # Cookies were rejected (expired or revoked SSO session): start clean and log in again
+        hitlLogger.info(f"🔁 Cached login session rejected for {test_user.user_id}, re-authenticating")
+        auth_cache.invalidate(test_user)
+        page.context.clear_cookies()
+        login.navigate(test_user.test_url, reporter, step_logger)
+
     login.login(test_user.user_id, test_user.password, reporter, step_logger)
     login.validate_login(test_user.user_id, reporter, step_logger)
+    auth_cache.save(page.context, test_user)
     allure.attach(test_user.user_id, name="Logged-in User")
 
 
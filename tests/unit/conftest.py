@@ -0,0 +1,12 @@
+import pytest
+
+
+# Unit tests need neither the automation DB nor an ADO run; override the session-wide autouse fixtures
+@pytest.fixture(scope="session", autouse=True)
+def setup_db():
+    yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def ado_runner():
+    yield None
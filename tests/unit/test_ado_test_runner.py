@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+import requests
+
+from ado.ado_test_runner import ADOTestRunner
+
+
+class FakeResponse:
+    def __init__(self, body: dict = None):
+        self.body = body or {}
+        self.text = ""
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeADOClient:
+    def __init__(self):
+        self.patches = []
+
+    def get(self, url, **kwargs):
+        return FakeResponse({"comment": ""})
+
+    def patch(self, url, **kwargs):
+        self.patches.append(kwargs.get("json"))
+        return FakeResponse()
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    monkeypatch.setenv("SUITE_TYPE", "unit")
+    monkeypatch.setenv("ADO_ASYNC_UPLOADS", "true")
+    monkeypatch.setenv("ADO_DEFERRED_RESULTS", "true")
+    runner = ADOTestRunner({"ado_org_url": "https://dev.azure.com/org", "ado_project": "project"})
+    runner.client = FakeADOClient()
+    runner.run_id = 1
+    runner.uploader.backoff_seconds = 0
+    return runner
+
+
+def test_complete_run_waits_for_queued_uploads(runner):
+    release = threading.Event()
+    uploaded = []
+
+    def slow_upload():
+        release.wait(timeout=5)
+        uploaded.append("screenshot")
+
+    runner.uploader.submit("screenshot", slow_upload)
+    # Finishes the upload only after complete_run() has started flushing and draining
+    threading.Timer(0.2, release.set).start()
+    runner.complete_run()
+
+    assert uploaded == ["screenshot"]
+    assert runner.failed_uploads == []
+
+
+def test_complete_run_reports_failed_uploads(runner):
+    def failing_upload():
+        raise RuntimeError("ADO unavailable")
+
+    runner.uploader.submit("step log", failing_upload)
+    runner.complete_run()
+
+    assert runner.failed_uploads == [("step log", "ADO unavailable")]
+
+
+def test_flush_keeps_the_upload_queue(runner):
+    uploader = runner.uploader
+    runner.pending_result_updates.append({"id": 1, "outcome": "Passed"})
+
+    runner.flush_result_updates()
+
+    assert runner.uploader is uploader
+    assert runner.client.patches == [[{"id": 1, "outcome": "Passed"}]]
+
+
+def test_rejected_result_batch_is_reported_at_run_completion(runner):
+    class RejectingADOClient(FakeADOClient):
+        def patch(self, url, **kwargs):
+            if "/results" in url:
+                raise requests.exceptions.HTTPError("400 Bad Request")
+            return super().patch(url, **kwargs)
+
+    runner.client = RejectingADOClient()
+    runner.pending_result_updates.append({"id": 7, "outcome": "Failed"})
+
+    with pytest.raises(RuntimeError, match="result ids: \\[7\\]"):
+        runner.complete_run()
@@ -3,7 +3,7 @@ import os
 import re
 import textwrap
 
-import requests
+from utils.ado.ado_client import get_ado_client
 
 ORG_URL = "https://dev.azure.com/Vizientinc"
 PROJECT = "VizTech"
@@ -29,7 +29,7 @@ def get_auth_headers():
 
 def fetch_user_story(story_id, headers):
     url = f"{ORG_URL}/{PROJECT}/_apis/wit/workitems/{story_id}?$expand=all&api-version={API_VERSION}"
-    r = requests.get(url, headers=headers)
+    r = get_ado_client().get(url, headers=headers)
     r.raise_for_status()
     return r.json()
 
@@ -65,7 +65,7 @@ def create_task_under_story(task, story_id, headers_patch):
             "attributes": {"comment": "Created from <li> in Acceptance Criteria"}
         }}
     ]
-    r = requests.post(url, headers=headers_patch, json=payload)
+    r = get_ado_client().post(url, headers=headers_patch, json=payload)
     r.raise_for_status()
     return r.json()["id"]
 
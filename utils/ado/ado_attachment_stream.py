@@ -0,0 +1,142 @@
+# utils/ado/ado_attachment_stream.py
+import base64
+import json
+import logging
+import os
+import shutil
+import subprocess
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+# Raw bytes read per step; a multiple of 3 so every chunk encodes without base64 padding
+READ_CHUNK_BYTES = 3 * 64 * 1024
+DEFAULT_MAX_ATTACHMENT_MB = 100
+
+
+class Base64JsonAttachmentStream:
+    """
+    File-like request body for the ADO attachments API:
+    {"fileName": ..., "comment": ..., "attachmentType": ..., "stream": "<base64>"}
+    The file is base64-encoded chunk by chunk while requests sends it, so memory
+    stays constant regardless of the attachment size. Content-Length is known
+    up front and seek(0) rewinds the body for retries.
+    """
+
+    def __init__(self, file_path: str, comment: str, attachment_type: str = "GeneralAttachment"):
+        self.file_path = file_path
+        header = json.dumps({
+            "fileName": os.path.basename(file_path),
+            "comment": comment,
+            "attachmentType": attachment_type
+        })
+        self._prefix = (header[:-1] + ', "stream": "').encode("utf-8")
+        self._suffix = b'"}'
+        file_size = os.path.getsize(file_path)
+        self._length = len(self._prefix) + 4 * ((file_size + 2) // 3) + len(self._suffix)
+        self._file = None
+        self._position = 0
+        self._buffer = b""
+        self._stage = "prefix"
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            yield chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if offset != 0 or whence != os.SEEK_SET:
+            raise OSError("Base64JsonAttachmentStream can only be rewound to the start")
+        self.close()
+        self._position = 0
+        self._buffer = b""
+        self._stage = "prefix"
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._length
+        while len(self._buffer) < size and self._stage != "done":
+            self._buffer += self._next_block()
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        self._position += len(data)
+        return data
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _next_block(self) -> bytes:
+        if self._stage == "prefix":
+            self._stage = "body"
+            self._file = open(self.file_path, "rb")
+            return self._prefix
+        if self._stage == "body":
+            raw = self._file.read(READ_CHUNK_BYTES)
+            if raw:
+                return base64.b64encode(raw)
+            self.close()
+            self._stage = "done"
+            return self._suffix
+        return b""
+
+
+def post_attachment(client, url: str, headers: dict, file_path: str, comment: str):
+    body = Base64JsonAttachmentStream(file_path, comment)
+    try:
+        r = client.post(url, headers=headers, data=body)
+        r.raise_for_status()
+        return r
+    finally:
+        body.close()
+
+
+def max_attachment_bytes() -> int:
+    return int(float(os.getenv("ADO_MAX_ATTACHMENT_MB", str(DEFAULT_MAX_ATTACHMENT_MB))) * 1024 * 1024)
+
+
+def fit_video_to_attachment_limit(file_path: str, max_bytes: int = None):
+    """
+    Returns a path that fits the ADO attachment limit: the original file when
+    small enough, otherwise an ffmpeg re-encode at a low bitrate, hard-trimmed
+    to the limit. Returns None when the video is too large and ffmpeg is missing.
+    """
+    max_bytes = max_bytes or max_attachment_bytes()
+    # The limit applies to the decoded attachment; keep a margin for the webm trailer
+    target_bytes = int(max_bytes * 0.95)
+    size = os.path.getsize(file_path)
+    if size <= max_bytes:
+        return file_path
+
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        hitlLogger.warning(
+            f"⚠️ Video {file_path} is {size / 1048576:.1f} MB (limit {max_bytes / 1048576:.0f} MB) "
+            f"and ffmpeg is not available to shrink it; skipping upload.")
+        return None
+
+    root, ext = os.path.splitext(file_path)
+    output_path = f"{root}_compressed{ext}"
+    command = [
+        ffmpeg, "-y", "-loglevel", "error", "-i", file_path,
+        "-c:v", "libvpx", "-b:v", "300k", "-crf", "40", "-deadline", "realtime",
+        "-an", "-fs", str(target_bytes), output_path
+    ]
+    try:
+        subprocess.run(command, check=True, timeout=600)
+    except Exception as e:
+        hitlLogger.warning(f"⚠️ Could not shrink video {file_path}: {e}")
+        return None
+
+    hitlLogger.info(
+        f"🎞️ Shrunk video {os.path.basename(file_path)} from {size / 1048576:.1f} MB "
+        f"to {os.path.getsize(output_path) / 1048576:.1f} MB for upload")
+    return output_path
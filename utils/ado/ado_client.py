@@ -0,0 +1,141 @@
+# utils/ado/ado_client.py
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# POSTs (create run, upload attachment) are only replayed when ADO rejected them outright
+RETRYABLE_POST_STATUS_CODES = {429, 503}
+
+
+class ADOClient:
+    """
+    Single keep-alive HTTP session for every Azure DevOps call.
+    Adds retry with exponential backoff (honouring Retry-After), a cap on
+    concurrent in-flight requests and per-endpoint latency metrics.
+    """
+
+    def __init__(self, pool_size: int = 16, max_retries: int = 4, backoff_seconds: float = 1.0,
+                 max_concurrency: int = 8, timeout: float = 60):
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._metrics_lock = threading.Lock()
+        self.metrics = defaultdict(lambda: {"calls": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0})
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        endpoint = self.endpoint_key(method, url)
+        retryable = RETRYABLE_POST_STATUS_CODES if method.upper() == "POST" else RETRYABLE_STATUS_CODES
+        attempt = 0
+
+        while True:
+            if attempt and hasattr(kwargs.get("data"), "seek"):
+                kwargs["data"].seek(0)  # replay streamed bodies from the start
+            start = time.perf_counter()
+            try:
+                with self._semaphore:
+                    response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                self._record(endpoint, start, error=True)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                hitlLogger.warning(f"🔁 ADO {endpoint} failed ({e}); retry {attempt + 1} in {delay:.1f}s")
+            else:
+                self._record(endpoint, start, error=response.status_code >= 400)
+                if response.status_code not in retryable or attempt >= self.max_retries:
+                    return response
+                delay = self._retry_after_delay(response) or self._backoff_delay(attempt)
+                hitlLogger.warning(
+                    f"🔁 ADO {endpoint} returned {response.status_code}; retry {attempt + 1} in {delay:.1f}s")
+
+            attempt += 1
+            with self._metrics_lock:
+                self.metrics[endpoint]["retries"] += 1
+            time.sleep(delay)
+
+    @staticmethod
+    def endpoint_key(method: str, url: str) -> str:
+        # Collapse numeric IDs so /runs/123/results and /runs/456/results share one bucket
+        path = re.sub(r"/\d+(?=/|$)", "/{id}", urlparse(url).path)
+        return f"{method.upper()} {path}"
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return self.backoff_seconds * (2 ** attempt) + random.uniform(0, self.backoff_seconds)
+
+    @staticmethod
+    def _retry_after_delay(response: requests.Response):
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return None
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                return None
+
+    def _record(self, endpoint: str, start: float, error: bool):
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._metrics_lock:
+            stats = self.metrics[endpoint]
+            stats["calls"] += 1
+            stats["errors"] += int(error)
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+
+    def log_metrics(self):
+        with self._metrics_lock:
+            snapshot = {k: dict(v) for k, v in self.metrics.items()}
+        if not snapshot:
+            return
+        hitlLogger.info("📊 ADO endpoint latency summary:")
+        for endpoint, stats in sorted(snapshot.items(), key=lambda kv: kv[1]["total_ms"], reverse=True):
+            avg_ms = stats["total_ms"] / stats["calls"] if stats["calls"] else 0
+            hitlLogger.info(
+                f"   {endpoint}: calls={stats['calls']}, avg={avg_ms:.0f}ms, max={stats['max_ms']:.0f}ms, "
+                f"errors={stats['errors']}, retries={stats['retries']}"
+            )
+
+
+_ado_client = None
+_ado_client_lock = threading.Lock()
+
+
+def get_ado_client() -> ADOClient:
+    global _ado_client
+    with _ado_client_lock:
+        if _ado_client is None:
+            _ado_client = ADOClient(
+                pool_size=int(os.getenv("ADO_POOL_SIZE", "16")),
+                max_retries=int(os.getenv("ADO_MAX_RETRIES", "4")),
+                max_concurrency=int(os.getenv("ADO_MAX_CONCURRENCY", "8"))
+            )
+        return _ado_client
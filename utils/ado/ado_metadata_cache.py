@@ -0,0 +1,130 @@
+# utils/ado/ado_metadata_cache.py
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlencode
+
+from utils.ado.ado_client import get_ado_client
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+
+class ADOMetadataCache:
+    """
+    Read-through cache for slow-changing ADO metadata (plans, suites, points,
+    test cases, builds). Entries live in memory for the session and, when a
+    cache directory is configured and the caller allows it, on disk across
+    runs (plan/suite names and build details only). Fresh entries are
+    served without a request; stale entries are revalidated with If-None-Match
+    so an unchanged resource costs a 304 instead of a full payload.
+    """
+
+    def __init__(self, ttl_seconds: int = 900, disk_dir: str = None):
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def get_json(self, url: str, headers: dict, params: dict = None, auth=None, persist: bool = True) -> dict:
+        """
+        persist=False keeps the entry in memory for this session only. Use it for
+        data that changes between runs (latest build, points, suite contents),
+        so a rerun never starts from another run's view of it.
+        """
+        key = url + ("?" + urlencode(sorted(params.items())) if params else "")
+        # Single-flight: concurrent callers of the same resource wait for one request
+        with self._key_lock(key):
+            entry = self._entries.get(key) or (self._load_from_disk(key) if persist else None)
+            if entry and time.time() - entry["fetched_at"] < self.ttl_seconds:
+                self._count("hits")
+                return entry["body"]
+
+            request_headers = dict(headers)
+            if entry and entry.get("etag"):
+                request_headers["If-None-Match"] = entry["etag"]
+
+            r = get_ado_client().get(url, headers=request_headers, params=params, auth=auth)
+            if entry and r.status_code == 304:
+                self._count("revalidated")
+                entry["fetched_at"] = time.time()
+            else:
+                r.raise_for_status()
+                self._count("misses")
+                entry = {"url": key, "etag": r.headers.get("ETag"), "fetched_at": time.time(), "body": r.json()}
+
+            self._entries[key] = entry
+            if persist:
+                self._save_to_disk(key, entry)
+            return entry["body"]
+
+    def invalidate(self, url: str = None):
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k.startswith(url)]:
+                    del self._entries[key]
+
+    def log_stats(self):
+        if self.hits or self.misses or self.revalidated:
+            hitlLogger.info(
+                f"📊 ADO metadata cache: hits={self.hits}, misses={self.misses}, revalidated={self.revalidated}")
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _load_from_disk(self, key: str):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            hitlLogger.warning(f"⚠️ Ignoring unreadable ADO metadata cache entry for {key}: {e}")
+            return None
+
+    def _save_to_disk(self, key: str, entry: dict):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            hitlLogger.warning(f"⚠️ Could not persist ADO metadata cache entry for {key}: {e}")
+
+
+_ado_metadata_cache = None
+_ado_metadata_cache_lock = threading.Lock()
+
+
+def get_ado_metadata_cache() -> ADOMetadataCache:
+    global _ado_metadata_cache
+    with _ado_metadata_cache_lock:
+        if _ado_metadata_cache is None:
+            _ado_metadata_cache = ADOMetadataCache(
+                ttl_seconds=int(os.getenv("ADO_METADATA_TTL_SECONDS", "900")),
+                disk_dir=os.getenv("ADO_METADATA_CACHE_DIR") or None
+            )
+        return _ado_metadata_cache
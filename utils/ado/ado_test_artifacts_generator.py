@@ -3,9 +3,10 @@ import os
 import re
 import textwrap
 
-import requests
 import yaml
 
+from utils.ado.ado_client import get_ado_client
+
 # Constants
 ORG_URL = "https://dev.azure.com/Vizientinc"
 PROJECT = "VizTech"
@@ -34,7 +35,7 @@ def get_auth_headers():
 
 def fetch_story(story_id: int, headers_json):
     url = f"{ORG_URL}/{PROJECT}/_apis/wit/workitems/{story_id}?$expand=all&api-version={API_VERSION}"
-    response = requests.get(url, headers=headers_json)
+    response = get_ado_client().get(url, headers=headers_json)
     response.raise_for_status()
     return response.json()
 
@@ -84,7 +85,7 @@ def create_task(task, story_id, headers_patch):
             "attributes": {"comment": "Created from <li> in Acceptance Criteria"}
         }}
     ]
-    r = requests.post(url, headers=headers_patch, json=payload)
+    r = get_ado_client().post(url, headers=headers_patch, json=payload)
     r.raise_for_status()
     return r.json()["id"]
 
@@ -105,7 +106,7 @@ def create_test_case_with_steps(story_id: int, title: str, acceptance_html: str,
             "attributes": {"comment": "Test case linked to story"}
         }}
     ]
-    r = requests.post(url, headers=headers_patch, json=payload)
+    r = get_ado_client().post(url, headers=headers_patch, json=payload)
     r.raise_for_status()
     test_case_id = r.json()["id"]
 
@@ -117,9 +118,9 @@ def create_test_case_with_steps(story_id: int, title: str, acceptance_html: str,
             for i, s in enumerate(steps)) + "</steps>"
         patch_url = f"{ORG_URL}/{PROJECT}/_apis/wit/workitems/{test_case_id}?api-version={API_VERSION}"
         patch_payload = [{"op": "add", "path": "/fields/Microsoft.VSTS.TCM.Steps", "value": content}]
-        requests.patch(patch_url, headers=headers_patch, json=patch_payload).raise_for_status()
+        get_ado_client().patch(patch_url, headers=headers_patch, json=patch_payload).raise_for_status()
 
-    requests.post(
+    get_ado_client().post(
         f"{ORG_URL}/{PROJECT}/_apis/test/Plans/{PLAN_ID}/suites/{SUITE_ID}/testcases/{test_case_id}?api-version={API_VERSION}",
         headers=headers_json).raise_for_status()
 
@@ -2,7 +2,7 @@
 import base64
 import os
 
-import requests
+from utils.ado.ado_metadata_cache import get_ado_metadata_cache
 
 
 def enrich_yaml_with_ado_test_case(meta: dict) -> dict:
@@ -23,9 +23,7 @@ def enrich_yaml_with_ado_test_case(meta: dict) -> dict:
 
     # Fetch test case info
     url = f"{org_url}/{project}/_apis/test/plans/{plan_id}/suites/{suite_id}/testcases/{case_id}?api-version=7.1-preview.3"
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    test_case = response.json()
+    test_case = get_ado_metadata_cache().get_json(url, headers, persist=False)
 
     # Inject useful fields
     meta["ado_case_title"] = test_case.get("testCase", {}).get("name")
@@ -1,6 +1,6 @@
 # utils/ado/ado_test_plan_reader.py
 
-import requests
+from utils.ado.ado_metadata_cache import get_ado_metadata_cache
 
 
 def fetch_total_planned_cases(ado_runner):
@@ -14,8 +14,5 @@ def fetch_total_planned_cases(ado_runner):
         "Content-Type": "application/json"
     }
 
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-
-    cases = response.json().get("value", [])
+    cases = get_ado_metadata_cache().get_json(url, headers, persist=False).get("value", [])
     return len(cases)
@@ -3,14 +3,15 @@ import base64
 import os
 from datetime import datetime
 
-import requests
-
 from email_utility.email_util import hitlLogger
+from utils.ado.ado_attachment_stream import post_attachment
+from utils.ado.ado_client import get_ado_client
 
 
 def generate_test_step_report_file(steps: list[dict], result_dir: str = "test_steps") -> str:
     os.makedirs(result_dir, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Microseconds keep back-to-back logs distinct while their uploads are still queued
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     file_path = os.path.join(result_dir, f"test_steps_{timestamp}.txt")
 
     with open(file_path, "w", encoding="utf-8", errors="replace") as f:
@@ -28,33 +29,24 @@ def generate_test_step_report_file(steps: list[dict], result_dir: str = "test_st
 
 
 def attach_step_report_to_ado(file_path: str, run_id: int, result_id: int, org_url: str, project: str, pat: str):
-    with open(file_path, "rb") as f:
-        content_base64 = base64.b64encode(f.read()).decode("utf-8")
-
     url = f"{org_url}/{project}/_apis/test/Runs/{run_id}/Results/{result_id}/attachments?api-version=7.1"
-    payload = {
-        "stream": content_base64,
-        "fileName": os.path.basename(file_path),
-        "comment": "Test step execution report",
-        "attachmentType": "GeneralAttachment"
-    }
-
     headers = {
         "Authorization": "Basic " + base64.b64encode(f":{pat}".encode()).decode(),
         "Content-Type": "application/json"
     }
 
-    r = requests.post(url, headers=headers, json=payload)
-    r.raise_for_status()
+    post_attachment(get_ado_client(), url, headers, file_path, "Test step execution report")
     hitlLogger.info("✅ Test step report attached to ADO test result.")
 
 
 def attach_and_upload_step_log(steps: list[dict], runner):
     """
-    Generates a step log file and attaches it to ADO test result.
+    Generates a step log file and queues its upload to the ADO test result.
     """
     file_path = generate_test_step_report_file(steps)
-    attach_step_report_to_ado(
+    runner.uploader.submit(
+        f"step log {os.path.basename(file_path)} -> result {runner.result_id}",
+        attach_step_report_to_ado,
         file_path=file_path,
         run_id=runner.run_id,
         result_id=runner.result_id,
@@ -0,0 +1,84 @@
+# utils/ado/ado_upload_queue.py
+import logging
+import queue
+import threading
+import time
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+
+class ADOUploadQueue:
+    """
+    Bounded background queue for ADO attachment uploads (videos, screenshots,
+    step logs, run summaries) so tests never wait on an upload. Call drain()
+    before completing the run; it blocks until every queued upload finished
+    and returns the uploads that still failed after retrying.
+    """
+
+    def __init__(self, worker_count: int = 4, max_queue_size: int = 32, max_retries: int = 2,
+                 backoff_seconds: float = 2.0, enabled: bool = True):
+        self.worker_count = worker_count
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.enabled = enabled
+        self.completed_uploads = 0
+        self.failed_uploads = []
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._workers = []
+
+    def submit(self, description: str, upload_func, *args, **kwargs):
+        if not self.enabled:
+            upload_func(*args, **kwargs)
+            return
+        self._start_workers()
+        # put() blocks when the queue is full, which applies back-pressure instead of buffering unbounded files
+        self._queue.put((description, upload_func, args, kwargs))
+
+    def drain(self) -> list:
+        if self._workers:
+            hitlLogger.info(f"⏳ Waiting for {self._queue.unfinished_tasks} pending ADO upload(s)...")
+            self._queue.join()
+        with self._lock:
+            failed = list(self.failed_uploads)
+            completed = self.completed_uploads
+        if failed:
+            hitlLogger.warning(f"❌ {len(failed)} ADO upload(s) failed:")
+            for description, error in failed:
+                hitlLogger.warning(f"   {description}: {error}")
+        elif completed:
+            hitlLogger.info(f"✅ All {completed} ADO upload(s) completed.")
+        return failed
+
+    def _start_workers(self):
+        with self._lock:
+            if self._workers:
+                return
+            for i in range(self.worker_count):
+                worker = threading.Thread(target=self._work, name=f"ado-upload-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            description, upload_func, args, kwargs = self._queue.get()
+            try:
+                self._upload_with_retry(description, upload_func, args, kwargs)
+            finally:
+                self._queue.task_done()
+
+    def _upload_with_retry(self, description, upload_func, args, kwargs):
+        for attempt in range(self.max_retries + 1):
+            try:
+                upload_func(*args, **kwargs)
+                with self._lock:
+                    self.completed_uploads += 1
+                return
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    with self._lock:
+                        self.failed_uploads.append((description, str(e)))
+                    return
+                delay = self.backoff_seconds * (2 ** attempt)
+                hitlLogger.warning(f"🔁 Upload '{description}' failed ({e}); retry {attempt + 1} in {delay:.0f}s")
+                time.sleep(delay)
@@ -1,8 +1,9 @@
 import os
 
-import requests
 from requests.auth import HTTPBasicAuth
 
+from utils.ado.ado_client import get_ado_client
+
 
 def get_latest_successful_build_number(
         organization: str,
@@ -19,7 +20,7 @@ def get_latest_successful_build_number(
         "api-version": "7.1-preview.7"
     }
 
-    response = requests.get(
+    response = get_ado_client().get(
         url,
         params=params,
         auth=HTTPBasicAuth('', pat_token)
@@ -2,12 +2,12 @@ import base64
 import os
 import re
 
-import requests
+from utils.ado.ado_client import get_ado_client
 
 
 def fetch_user_story_details(org_url, project, story_id, headers_json):
     url = f"{org_url}/{project}/_apis/wit/workitems/{story_id}?$expand=all&api-version=7.1-preview.3"
-    response = requests.get(url, headers=headers_json)
+    response = get_ado_client().get(url, headers=headers_json)
     response.raise_for_status()
     story = response.json()
     title = story.get("fields", {}).get("System.Title", f"Test Case for Story {story_id}")
@@ -62,7 +62,7 @@ def create_ado_test_case():
             "attributes": {"comment": "Test case linked to story"}
         }}
     ]
-    resp = requests.post(url_create, headers=headers_patch, json=test_case_payload)
+    resp = get_ado_client().post(url_create, headers=headers_patch, json=test_case_payload)
     resp.raise_for_status()
     test_case_id = resp.json()["id"]
     print(f"✅ Created Test Case ID: {test_case_id}")
@@ -84,13 +84,13 @@ def create_ado_test_case():
         steps_content += "</steps>"
         url_steps = f"{org_url}/{project}/_apis/wit/workitems/{test_case_id}?api-version=7.1-preview.3"
         steps_payload = [{"op": "add", "path": "/fields/Microsoft.VSTS.TCM.Steps", "value": steps_content}]
-        r = requests.patch(url_steps, headers=headers_patch, json=steps_payload)
+        r = get_ado_client().patch(url_steps, headers=headers_patch, json=steps_payload)
         r.raise_for_status()
         print("✅ Added dynamic test steps from acceptance criteria.")
 
     # Add to test suite
     url_add = f"{org_url}/{project}/_apis/test/Plans/{plan_id}/suites/{suite_id}/testcases/{test_case_id}?api-version=7.1-preview.3"
-    r = requests.post(url_add, headers=headers_json)
+    r = get_ado_client().post(url_add, headers=headers_json)
     r.raise_for_status()
     print("✅ Added test case to regression suite.")
 
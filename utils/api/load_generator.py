@@ -0,0 +1,156 @@
+import logging
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+
+@dataclass
+class LoadSample:
+    index: int
+    started_at: datetime
+    latency_ms: float
+    status_code: Optional[int]
+    ok: bool
+    error: Optional[str] = None
+    response_bytes: int = 0
+
+
+@dataclass
+class LoadTestReport:
+    samples: List[LoadSample]
+    duration_seconds: float
+    concurrency: int
+    started_at: datetime = None
+    ended_at: datetime = None
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return len(self.samples)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for sample in self.samples if not sample.ok)
+
+    @property
+    def failure_percent(self) -> float:
+        return 100.0 * self.failed / self.total if self.total else 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.duration_seconds if self.duration_seconds else 0.0
+
+    def latency_percentiles(self, percentiles=(50, 90, 95, 99)) -> dict:
+        latencies = np.array([sample.latency_ms for sample in self.samples])
+        if not latencies.size:
+            return {p: 0.0 for p in percentiles}
+        return dict(zip(percentiles, np.percentile(latencies, percentiles).tolist()))
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return float(np.mean([sample.latency_ms for sample in self.samples])) if self.samples else 0.0
+
+    def summary(self) -> str:
+        p = self.latency_percentiles()
+        errors = ", ".join(f"{reason}: {count}" for reason, count in self.errors.most_common()) or "none"
+        return (
+            f"{self.total} requests in {self.duration_seconds:.2f}s with concurrency {self.concurrency} "
+            f"→ {self.throughput:.1f} req/s | latency avg={self.avg_latency_ms:.0f}ms "
+            f"p50={p[50]:.0f}ms p90={p[90]:.0f}ms p95={p[95]:.0f}ms p99={p[99]:.0f}ms | "
+            f"failed={self.failed} ({self.failure_percent:.1f}%) [{errors}]"
+        )
+
+
+class LoadGenerator:
+    """
+    Sends requests from a pool of worker threads over one keep-alive session.
+    The run stops after total_requests or duration_seconds, whichever comes
+    first; target_rps (optional) paces request starts across all workers.
+    send(session, index) performs one request and returns the Response;
+    is_success(response) decides whether it counts as a success.
+    """
+
+    def __init__(self, concurrency: int = 10, target_rps: float = None, duration_seconds: float = None,
+                 total_requests: int = None, is_success: Callable = None):
+        if not duration_seconds and not total_requests:
+            raise ValueError("LoadGenerator needs duration_seconds or total_requests")
+        self.concurrency = concurrency
+        self.target_rps = target_rps
+        self.duration_seconds = duration_seconds
+        self.total_requests = total_requests
+        self.is_success = is_success or (lambda response: response.ok)
+        self._next_index = 0
+        self._lock = threading.Lock()
+
+    def run(self, send: Callable[[requests.Session, int], requests.Response]) -> LoadTestReport:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        self._next_index = 0
+        started_at = datetime.now()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load") as executor:
+            futures = [executor.submit(self._worker, session, send, start) for _ in range(self.concurrency)]
+            samples = [sample for future in futures for sample in future.result()]
+        duration = time.perf_counter() - start
+        session.close()
+
+        samples.sort(key=lambda sample: sample.index)
+        errors = Counter(sample.error for sample in samples if not sample.ok)
+        report = LoadTestReport(samples=samples, duration_seconds=duration, concurrency=self.concurrency,
+                                started_at=started_at, ended_at=datetime.now(), errors=errors)
+        hitlLogger.info(f"📈 Load run: {report.summary()}")
+        return report
+
+    def _claim_next(self, start: float) -> Optional[tuple]:
+        with self._lock:
+            index = self._next_index
+            if self.total_requests is not None and index >= self.total_requests:
+                return None
+            scheduled = start + index / self.target_rps if self.target_rps else time.perf_counter()
+            if self.duration_seconds and scheduled - start >= self.duration_seconds:
+                return None
+            self._next_index += 1
+            return index, scheduled
+
+    def _worker(self, session, send, start: float) -> List[LoadSample]:
+        samples = []
+        while True:
+            claim = self._claim_next(start)
+            if claim is None:
+                return samples
+            index, scheduled = claim
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            if self.duration_seconds and time.perf_counter() - start >= self.duration_seconds:
+                return samples
+            samples.append(self._send_one(session, send, index))
+
+    def _send_one(self, session, send, index: int) -> LoadSample:
+        started_at = datetime.now()
+        request_start = time.perf_counter()
+        try:
+            response = send(session, index)
+        except requests.exceptions.RequestException as e:
+            return LoadSample(index=index, started_at=started_at,
+                              latency_ms=(time.perf_counter() - request_start) * 1000,
+                              status_code=None, ok=False, error=type(e).__name__)
+        latency_ms = (time.perf_counter() - request_start) * 1000
+        ok = self.is_success(response)
+        return LoadSample(index=index, started_at=started_at, latency_ms=latency_ms,
+                          status_code=response.status_code, ok=ok,
+                          error=None if ok else f"HTTP {response.status_code}",
+                          response_bytes=len(response.content or b""))
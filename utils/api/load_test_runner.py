@@ -0,0 +1,113 @@
+import logging
+import math
+import os
+import socket
+import uuid
+from typing import Callable
+
+import requests
+
+from api_config.api_config_loader import load_load_test_settings
+from dao.api_test_dao import APITestDAO
+from db_engine.test_automation_engine import get_test_db_session
+from utils.api.load_generator import LoadGenerator, LoadTestReport
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+
+def run_load_test(send: Callable[[requests.Session, int], requests.Response], settings: dict = None,
+                  service_id: int = None, test_case_id: int = None, is_success: Callable = None,
+                  target_rps: float = None, duration_seconds: float = None) -> LoadTestReport:
+    """
+    Runs Workers x TasksPerWorker requests (from settings.yaml unless settings
+    is given) on settings Concurrency threads (one per worker by default), or
+    keeps sending for duration_seconds when set; target_rps caps the rate.
+    Arguments override the settings. The run and its samples are then stored
+    in API_Test_Run / API_Test_Result.
+    """
+    settings = settings or load_load_test_settings()
+    duration_seconds = duration_seconds or settings.get("duration_seconds")
+    target_rps = target_rps or settings.get("target_rps")
+    concurrency = settings.get("concurrency") or settings["workers"]
+    load = LoadGenerator(
+        concurrency=concurrency,
+        total_requests=None if duration_seconds else settings["workers"] * settings["tasks_per_worker"],
+        duration_seconds=duration_seconds,
+        target_rps=target_rps,
+        is_success=is_success
+    )
+    report = load.run(send)
+    # Stored Workers is the thread count actually used; per-worker count is then derived
+    # from the samples unless it is exactly the configured Workers x TasksPerWorker split
+    exact_split = not duration_seconds and concurrency == settings["workers"]
+    save_load_test_run(report, settings["test_tag"], concurrency,
+                       settings["tasks_per_worker"] if exact_split else None,
+                       service_id=service_id, test_case_id=test_case_id)
+    return report
+
+
+def save_load_test_run(report: LoadTestReport, test_tag: str, workers: int = None, tasks_per_worker: int = None,
+                       service_id: int = None, test_case_id: int = None):
+    """
+    Inserts the aggregated APITestRun, then bulk-inserts one APITestResult per
+    sample. Returns the run id, or None when persisting is disabled
+    (LOAD_TEST_PERSIST=false) or failed; a history write never fails the test.
+    """
+    if os.getenv("LOAD_TEST_PERSIST", "true").lower() != "true" or not report.samples:
+        return None
+
+    machine_ip = get_machine_ip()
+    workers = workers or report.concurrency
+    tasks_per_worker = tasks_per_worker or math.ceil(report.total / workers)
+    percentiles = report.latency_percentiles((90, 95, 99))
+
+    session = get_test_db_session()
+    try:
+        run = APITestDAO.insert_test_run(session, {
+            "service_id": service_id,
+            "test_case_id": test_case_id,
+            "machine_ip": machine_ip,
+            "workers": workers,
+            "tasks_per_worker": tasks_per_worker,
+            "avg_response_time": round(report.avg_latency_ms),
+            "percentile_90": round(percentiles[90]),
+            "percentile_95": round(percentiles[95]),
+            "percentile_99": round(percentiles[99]),
+            "failure_percent": round(report.failure_percent),
+            "test_tag": test_tag,
+            "start_run_timestamp": report.started_at,
+            "end_run_timestamp": report.ended_at
+        })
+        inserted = APITestDAO.bulk_insert_test_results(session, [
+            {
+                "test_run_id": run.run_id,
+                "test_result_uuid": str(uuid.uuid4()),
+                "machine_ip": machine_ip,
+                "response_code": sample.status_code,
+                "response_time": round(sample.latency_ms),
+                "latency": round(sample.latency_ms),
+                "size_in_bytes": sample.response_bytes,
+                "body_size_in_byte": sample.response_bytes,
+                "sample_count": 1,
+                "response_code_error_count": 0 if sample.ok else 1,
+                "response_assertion_outcome": "PASS" if sample.ok else "FAIL",
+                "response_message": sample.error,
+                "datetime": sample.started_at
+            }
+            for sample in report.samples
+        ])
+        hitlLogger.info(f"📝 Saved load test run {run.run_id} ({test_tag}) with {inserted} sample(s)")
+        return run.run_id
+    except Exception as e:
+        session.rollback()
+        hitlLogger.warning(f"⚠️ Could not save load test results for '{test_tag}': {e}")
+        return None
+    finally:
+        session.close()
+
+
+def get_machine_ip() -> str:
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "unknown"
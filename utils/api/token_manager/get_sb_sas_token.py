@@ -1,6 +1,7 @@
 import base64
 import hashlib
 import hmac
+import threading
 import time
 import urllib.parse
 
@@ -38,4 +39,30 @@ def generate_sas_token(uri: str, key_name: str, key: str, expiry_in_seconds: int
         f"SharedAccessSignature sr={encode_uri_component(uri)}"
         f"&sig={encode_uri_component(signature)}"
         f"&se={expiry}&skn={key_name}"
-    ) 
\ No newline at end of file
+    )
+
+
+class SasTokenProvider:
+    """
+    Hands out one SAS token per expiry window instead of signing a new token
+    for every message. A fresh token is generated refresh_margin seconds
+    before the current one expires. Safe to share between threads.
+    """
+
+    def __init__(self, uri: str, key_name: str, key: str, expiry_in_seconds: int = 3600,
+                 refresh_margin_seconds: int = 60):
+        self.uri = uri
+        self.key_name = key_name
+        self.key = key
+        self.expiry_in_seconds = expiry_in_seconds
+        self.refresh_margin_seconds = min(refresh_margin_seconds, expiry_in_seconds // 2)
+        self._token = None
+        self._expires_at = 0
+        self._lock = threading.Lock()
+
+    def token(self) -> str:
+        with self._lock:
+            if time.time() >= self._expires_at - self.refresh_margin_seconds:
+                self._token = generate_sas_token(self.uri, self.key_name, self.key, self.expiry_in_seconds)
+                self._expires_at = time.time() + self.expiry_in_seconds
+            return self._token
@@ -0,0 +1,108 @@
+import logging
+import os
+import threading
+import time
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+DEFAULT_EXPIRES_IN_SECONDS = 3600
+
+
+class TokenCache:
+    """
+    Process-wide cache of OAuth access tokens keyed by (kind, env, service_desc, request_type).
+    A token is served from memory until expiry_margin seconds before it expires.
+    Once it is within refresh_ahead seconds of expiry, callers still get the cached
+    token while a single background thread fetches its replacement.
+    """
+
+    def __init__(self, refresh_ahead_seconds: float = 300, expiry_margin_seconds: float = 30):
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.expiry_margin_seconds = expiry_margin_seconds
+        self.hits = 0
+        self.misses = 0
+        self.background_refreshes = 0
+        self._tokens = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def get_token(self, key: tuple, fetch_token) -> str:
+        """
+        fetch_token() must return the token endpoint's JSON response
+        ({"access_token": ..., "expires_in": ...}).
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._tokens.get(key)
+            if entry and now < entry["expires_at"] - self.expiry_margin_seconds:
+                self.hits += 1
+                if now >= entry["refresh_at"] and key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(target=self._refresh_in_background, args=(key, fetch_token),
+                                     name="token-refresh", daemon=True).start()
+                return entry["token"]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # One caller per key fetches; the others wait and reuse its token
+        with key_lock:
+            with self._lock:
+                entry = self._tokens.get(key)
+                if entry and time.time() < entry["expires_at"] - self.expiry_margin_seconds:
+                    self.hits += 1
+                    return entry["token"]
+                self.misses += 1
+            return self._store(key, fetch_token())
+
+    def invalidate(self, key: tuple = None):
+        with self._lock:
+            if key is None:
+                self._tokens.clear()
+            else:
+                self._tokens.pop(key, None)
+
+    def log_stats(self):
+        if self.hits or self.misses:
+            hitlLogger.info(
+                f"📊 Token cache: hits={self.hits}, misses={self.misses}, "
+                f"background_refreshes={self.background_refreshes}")
+
+    def _store(self, key: tuple, token_response: dict) -> str:
+        token = token_response.get("access_token")
+        expires_in = float(token_response.get("expires_in") or DEFAULT_EXPIRES_IN_SECONDS)
+        fetched_at = time.time()
+        # Short-lived tokens refresh halfway through their lifetime at the latest
+        refresh_ahead = min(self.refresh_ahead_seconds, expires_in / 2)
+        with self._lock:
+            self._tokens[key] = {
+                "token": token,
+                "expires_at": fetched_at + expires_in,
+                "refresh_at": fetched_at + expires_in - refresh_ahead
+            }
+        return token
+
+    def _refresh_in_background(self, key: tuple, fetch_token):
+        try:
+            self._store(key, fetch_token())
+            with self._lock:
+                self.background_refreshes += 1
+        except Exception as e:
+            hitlLogger.warning(f"⚠️ Background token refresh failed for {key[:2]}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+_token_cache = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    global _token_cache
+    with _token_cache_lock:
+        if _token_cache is None:
+            _token_cache = TokenCache(
+                refresh_ahead_seconds=float(os.getenv("TOKEN_REFRESH_AHEAD_SECONDS", "300")),
+                expiry_margin_seconds=float(os.getenv("TOKEN_EXPIRY_MARGIN_SECONDS", "30"))
+            )
+        return _token_cache
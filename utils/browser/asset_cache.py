@@ -0,0 +1,158 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Route
+
+from utils.generic.get_project_root import get_project_root
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+STATIC_RESOURCE_TYPES = ("script", "stylesheet", "font")
+ASSET_URL_PATTERN = re.compile(r"\.(js|mjs|css|woff2?|ttf|otf|eot)(\?.*)?$", re.IGNORECASE)
+# Angular CLI output hashes: main.1a2b3c4d5e6f7a8b.js (webpack) or chunk-AB12CD34.js (esbuild)
+HASHED_NAME_PATTERN = re.compile(r"[.-]([0-9a-f]{16,20}|[A-Z0-9]{8})\.[a-z0-9]+$")
+STORED_HEADERS = ("content-type", "access-control-allow-origin", "cache-control")
+
+
+class StaticAssetCache:
+    """
+    Serves immutable JS/CSS/font responses of the HITL UI from a
+    content-addressed disk store shared by all tests and xdist workers, via
+    BrowserContext.route. Only GET responses with a hashed file name or
+    Cache-Control: immutable are stored; HTML, XHR and everything else go to
+    the network untouched. A blob whose digest no longer matches its index
+    entry is dropped and the request is sent to the network instead.
+    """
+
+    def __init__(self, cache_dir: str, enabled: bool = False):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.bytes_served = 0
+        self._lock = threading.Lock()
+        if self.enabled:
+            os.makedirs(os.path.join(self.cache_dir, "index"), exist_ok=True)
+            os.makedirs(os.path.join(self.cache_dir, "blobs"), exist_ok=True)
+
+    def context_options(self) -> dict:
+        """Extra new_context() options; a service worker would answer before page.route sees the request."""
+        return {"service_workers": "block"} if self.enabled else {}
+
+    def attach(self, context: BrowserContext):
+        if self.enabled:
+            context.route(ASSET_URL_PATTERN, self._handle)
+
+    def log_stats(self):
+        if not self.enabled:
+            return
+        hitlLogger.info(f"📦 Asset cache: hits={self.hits}, misses={self.misses}, bypassed={self.bypassed}, "
+                        f"served={self.bytes_served / 1024 / 1024:.1f} MB from disk")
+
+    def _handle(self, route: Route):
+        request = route.request
+        if request.method != "GET" or request.resource_type not in STATIC_RESOURCE_TYPES:
+            route.fallback()
+            return
+
+        entry = self._read_entry(request.url)
+        if entry:
+            body = self._read_blob(entry)
+            if body is not None:
+                self._count("hits", len(body))
+                route.fulfill(status=200, headers=entry["headers"], body=body)
+                return
+
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Exception as e:
+            hitlLogger.warning(f"⚠️ Asset cache fetch failed, passing through {request.url}: {e}")
+            route.fallback()
+            return
+
+        self._count("misses")
+        if response.status == 200 and self._is_immutable(request.url, response.headers):
+            self._store(request.url, response.headers, body)
+        route.fulfill(response=response, body=body)
+
+    @staticmethod
+    def _is_immutable(url: str, headers: dict) -> bool:
+        file_name = urlsplit(url).path.rsplit("/", 1)[-1]
+        return bool(HASHED_NAME_PATTERN.search(file_name)) or "immutable" in headers.get("cache-control", "")
+
+    def _index_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, "index", hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, "blobs", digest)
+
+    def _read_entry(self, url: str):
+        try:
+            with open(self._index_path(url), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_blob(self, entry: dict):
+        try:
+            with open(self._blob_path(entry["sha256"]), "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+        if hashlib.sha256(body).hexdigest() != entry["sha256"]:
+            hitlLogger.warning(f"⚠️ Asset cache digest mismatch, bypassing cache for {entry['url']}")
+            self._count("bypassed")
+            for path in (self._index_path(entry["url"]), self._blob_path(entry["sha256"])):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            return None
+        return body
+
+    def _store(self, url: str, headers: dict, body: bytes):
+        digest = hashlib.sha256(body).hexdigest()
+        entry = {
+            "url": url,
+            "sha256": digest,
+            "headers": {name: headers[name] for name in STORED_HEADERS if name in headers}
+        }
+        try:
+            # Same content from another URL or worker is stored once
+            if not os.path.exists(self._blob_path(digest)):
+                self._write_atomic(self._blob_path(digest), body)
+            self._write_atomic(self._index_path(url), json.dumps(entry).encode("utf-8"))
+        except OSError as e:
+            hitlLogger.warning(f"⚠️ Could not store {url} in asset cache: {e}")
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes):
+        # Unique temp name per process/thread so parallel workers never share one
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _count(self, name: str, served_bytes: int = 0):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+            self.bytes_served += served_bytes
+
+
+_asset_cache = None
+
+
+def get_asset_cache() -> StaticAssetCache:
+    global _asset_cache
+    if _asset_cache is None:
+        enabled = os.getenv("ASSET_CACHE", "false").lower() == "true"
+        cache_dir = os.getenv("ASSET_CACHE_DIR", os.path.join(get_project_root(), ".asset_cache"))
+        _asset_cache = StaticAssetCache(cache_dir, enabled)
+    return _asset_cache
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import logging
+import os
+import time
+import weakref
+
+from playwright.sync_api import BrowserContext
+
+from utils.generic.get_project_root import get_project_root
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+DEFAULT_TTL_MINUTES = 45
+
+
+class AuthStateCache:
+    """
+    Persists the Playwright storage_state of an authenticated SSO session so the
+    interactive Email -> Next -> Password -> Sign in flow runs once per worker
+    per user/environment instead of once per test.
+    """
+
+    def __init__(self, cache_dir: str, ttl_minutes: int = DEFAULT_TTL_MINUTES, enabled: bool = True):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self.ttl_seconds = ttl_minutes * 60
+        self.worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+        self._injected_contexts = weakref.WeakSet()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def state_path(self, test_user) -> str:
+        key = f"{test_user.test_env}|{test_user.test_url}|{test_user.user_id}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{test_user.test_env}_{self.worker_id}_{digest}.json")
+
+    def has_valid_state(self, test_user) -> bool:
+        if not self.enabled:
+            return False
+        path = self.state_path(test_user)
+        if not os.path.exists(path):
+            return False
+        age = time.time() - os.path.getmtime(path)
+        if age > self.ttl_seconds:
+            hitlLogger.info(f"⌛ Cached login state expired ({age / 60:.0f} min old): {path}")
+            self.invalidate(test_user)
+            return False
+        return True
+
+    def context_options(self, test_user) -> dict:
+        """Extra new_context() options that inject the cached session, if any."""
+        if self.has_valid_state(test_user):
+            hitlLogger.info(f"🍪 Injecting cached login state for {test_user.user_id} ({test_user.test_env})")
+            return {"storage_state": self.state_path(test_user)}
+        return {}
+
+    def mark_injected(self, context: BrowserContext):
+        """Records that context was created with the cached state, so the TTL is checked only once."""
+        self._injected_contexts.add(context)
+
+    def was_injected(self, context: BrowserContext) -> bool:
+        return context in self._injected_contexts
+
+    def save(self, context: BrowserContext, test_user):
+        if not self.enabled:
+            return
+        path = self.state_path(test_user)
+        state = context.storage_state()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+        hitlLogger.info(f"💾 Saved login state for {test_user.user_id} ({test_user.test_env}) to {path}")
+
+    def invalidate(self, test_user):
+        path = self.state_path(test_user)
+        try:
+            os.remove(path)
+            hitlLogger.info(f"🗑️ Removed cached login state: {path}")
+        except FileNotFoundError:
+            pass
+
+
+_auth_state_cache = None
+
+
+def get_auth_state_cache() -> AuthStateCache:
+    global _auth_state_cache
+    if _auth_state_cache is None:
+        ttl_minutes = int(os.getenv("AUTH_STATE_TTL_MINUTES", str(DEFAULT_TTL_MINUTES)))
+        enabled = os.getenv("AUTH_STATE_CACHE", "true").lower() == "true"
+        _auth_state_cache = AuthStateCache(os.path.join(get_project_root(), ".auth"), ttl_minutes, enabled)
+    return _auth_state_cache
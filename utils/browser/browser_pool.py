@@ -0,0 +1,84 @@
+import logging
+import os
+import time
+
+from playwright.sync_api import Browser, BrowserContext, Playwright
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+DEFAULT_LAUNCH_ARGS = ["--window-size=1980,1080", "--window-position=0,0"]
+
+
+class BrowserPool:
+    """
+    Keeps one Chromium process alive per pytest worker and hands out a fresh,
+    isolated BrowserContext per test. The browser is relaunched after
+    `recycle_after` contexts to keep renderer memory growth in check
+    (0 disables recycling).
+    """
+
+    def __init__(self, playwright: Playwright, headless: bool = True, launch_args: list = None,
+                 recycle_after: int = 0):
+        self.playwright = playwright
+        self.headless = headless
+        self.launch_args = launch_args or DEFAULT_LAUNCH_ARGS
+        self.recycle_after = recycle_after
+        self.browser: Browser = None
+        self.contexts_served = 0
+        self.contexts_since_launch = 0
+        self.launch_count = 0
+        self.total_launch_seconds = 0.0
+        self.total_context_seconds = 0.0
+
+    def get_browser(self) -> Browser:
+        if self.browser is None or not self.browser.is_connected():
+            self._launch()
+        return self.browser
+
+    def new_context(self, **context_options) -> BrowserContext:
+        if self.recycle_after and self.contexts_since_launch >= self.recycle_after:
+            hitlLogger.info(f"♻️ Recycling browser after {self.contexts_since_launch} test(s)")
+            self._close_browser()
+
+        browser = self.get_browser()
+        start = time.perf_counter()
+        context = browser.new_context(**context_options)
+        elapsed = time.perf_counter() - start
+
+        self.total_context_seconds += elapsed
+        self.contexts_served += 1
+        self.contexts_since_launch += 1
+        hitlLogger.info(f"🧩 New browser context #{self.contexts_served} created in {elapsed * 1000:.0f} ms")
+        return context
+
+    def release_context(self, context: BrowserContext):
+        try:
+            context.close()
+        except Exception as e:
+            hitlLogger.warning(f"⚠️ Failed to close browser context: {e}")
+
+    def close(self):
+        self._close_browser()
+        hitlLogger.info(
+            f"📊 Browser pool summary: launches={self.launch_count}, "
+            f"launch_time={self.total_launch_seconds:.2f}s, contexts={self.contexts_served}, "
+            f"context_time={self.total_context_seconds:.2f}s"
+        )
+
+    def _launch(self):
+        start = time.perf_counter()
+        self.browser = self.playwright.chromium.launch(headless=self.headless, args=self.launch_args)
+        elapsed = time.perf_counter() - start
+
+        self.launch_count += 1
+        self.total_launch_seconds += elapsed
+        self.contexts_since_launch = 0
+        hitlLogger.info(f"🚀 Chromium launched (worker pid {os.getpid()}) in {elapsed:.2f}s")
+
+    def _close_browser(self):
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception as e:
+                hitlLogger.warning(f"⚠️ Failed to close browser: {e}")
+            self.browser = None
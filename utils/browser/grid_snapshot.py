@@ -0,0 +1,65 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from playwright.sync_api import Page
+
+# Reads headers and rendered rows of an AG Grid in one browser round trip
+_SNAPSHOT_SCRIPT = """
+(rootSelector) => {
+    const scope = rootSelector ? document.querySelector(rootSelector) : document;
+    if (!scope) {
+        return { columns: [], rows: [] };
+    }
+    const columns = [...scope.querySelectorAll('.ag-header-cell')].map((header, index) => ({
+        index,
+        label: header.innerText.trim(),
+        field: header.getAttribute('col-id')
+    }));
+    const rows = [...scope.querySelectorAll('.ag-center-cols-container .ag-row')].map((row, index) => {
+        const cells = {};
+        for (const cell of row.querySelectorAll('.ag-cell')) {
+            const colId = cell.getAttribute('col-id');
+            if (colId) {
+                cells[colId] = cell.innerText;
+            }
+        }
+        return { index, rowId: row.getAttribute('row-id'), rowIndex: row.getAttribute('row-index'), cells };
+    });
+    return { columns, rows };
+}
+"""
+
+
+@dataclass
+class GridColumn:
+    index: int  # position among .ag-header-cell elements, usable with locator.nth()
+    label: str
+    field: Optional[str]
+
+
+@dataclass
+class GridRow:
+    index: int  # DOM position among rendered rows, usable with locator.nth()
+    row_id: Optional[str]
+    row_index: Optional[str]
+    cells: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class GridSnapshot:
+    columns: List[GridColumn]
+    rows: List[GridRow]
+
+
+def take_grid_snapshot(page: Page, root_selector: str = None) -> GridSnapshot:
+    """
+    Returns every header and every rendered row (cell text keyed by col-id) of
+    the AG Grid under root_selector, or of the whole page, with one evaluate call.
+    Only rows AG Grid has rendered are included (row virtualisation).
+    """
+    raw = page.evaluate(_SNAPSHOT_SCRIPT, root_selector)
+    return GridSnapshot(
+        columns=[GridColumn(index=c["index"], label=c["label"], field=c["field"]) for c in raw["columns"]],
+        rows=[GridRow(index=r["index"], row_id=r["rowId"], row_index=r["rowIndex"], cells=r["cells"])
+              for r in raw["rows"]]
+    )
@@ -0,0 +1,82 @@
+# utils/browser/highlight_mode_benchmark.py
+"""
+Times the same LoggerPage flow in every highlight mode against a local page,
+so the per-test saving of ci/trace over demo can be measured without the
+HITL environment:
+
+    python -m utils.browser.highlight_mode_benchmark --actions 40 --runs 3
+"""
+import argparse
+import statistics
+import time
+
+from playwright.sync_api import sync_playwright
+
+from lib.hitl_logger import HIGHLIGHT_MODES, LoggerPage
+
+_FORM_HTML = """
+<html><body>
+    <input id="name"><input id="note"><input id="agree" type="checkbox">
+    <button id="save" onclick="document.getElementById('status').innerText = 'Saved'">Save</button>
+    <div id="status"></div>
+</body></html>
+"""
+
+
+def run_flow(log: LoggerPage, page, actions: int):
+    """One 'test': a mix of fills, checks and clicks like a task-manager flow."""
+    for i in range(actions):
+        step = i % 4
+        if step == 0:
+            log.fill(page.locator("#name"), f"Task {i}", "Name")
+        elif step == 1:
+            log.fill(page.locator("#note"), "Automatically corrected", "Note")
+        elif step == 2:
+            page.locator("#agree").uncheck()
+            log.check(page.locator("#agree"), "Agree")
+        else:
+            log.click(page.locator("#save"), "Save")
+
+
+def benchmark(actions: int, runs: int) -> dict:
+    results = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        for mode in HIGHLIGHT_MODES:
+            context = browser.new_context()
+            if mode == "trace":
+                context.tracing.start(snapshots=True)
+            page = context.new_page()
+            page.set_content(_FORM_HTML)
+            log = LoggerPage(page, mode=mode)
+
+            durations = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                run_flow(log, page, actions)
+                durations.append(time.perf_counter() - start)
+
+            if mode == "trace":
+                context.tracing.stop()
+            context.close()
+            results[mode] = statistics.median(durations)
+        browser.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare LoggerPage highlight modes")
+    parser.add_argument("--actions", type=int, default=40, help="UI actions per simulated test")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions per mode (median is reported)")
+    args = parser.parse_args()
+
+    results = benchmark(args.actions, args.runs)
+    baseline = results["demo"]
+    print(f"{args.actions} actions per test, median of {args.runs} run(s)")
+    for mode, seconds in results.items():
+        print(f"  {mode:<6} {seconds:7.2f}s per test  {seconds / args.actions * 1000:6.0f}ms per action  "
+              f"saves {baseline - seconds:6.2f}s vs demo")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import importlib.util
+import logging
+import os
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+# Same values as Playwright's own "video" option
+VIDEO_POLICIES = ("off", "on", "retain-on-failure", "on-first-retry")
+DEFAULT_VIDEO_POLICY = "retain-on-failure"
+
+
+def get_video_policy() -> str:
+    policy = os.getenv("VIDEO_RECORDING", DEFAULT_VIDEO_POLICY).lower()
+    if policy not in VIDEO_POLICIES:
+        raise ValueError(f"VIDEO_RECORDING must be one of {', '.join(VIDEO_POLICIES)}, got: {policy}")
+    if policy == "on-first-retry" and importlib.util.find_spec("pytest_rerunfailures") is None:
+        # Without a retry plugin no test is ever retried, so this policy would silently record nothing
+        raise ValueError("VIDEO_RECORDING=on-first-retry needs pytest-rerunfailures (run with --reruns N)")
+    return policy
+
+
+def should_record_video(policy: str, item) -> bool:
+    """Whether the context of this test gets record_video_dir at all."""
+    if policy == "on-first-retry":
+        # execution_count is set by pytest-rerunfailures (required by get_video_policy for this policy)
+        return getattr(item, "execution_count", 1) == 2
+    return policy != "off"
+
+
+def has_failed(item) -> bool:
+    return any(getattr(getattr(item, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+
+
+def should_keep_video(policy: str, item) -> bool:
+    """Whether a recorded video is kept for upload; a passing test's video is deleted under retain-on-failure."""
+    if policy == "retain-on-failure":
+        return has_failed(item)
+    return policy in ("on", "on-first-retry")
@@ -0,0 +1,197 @@
+import logging
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from playwright.sync_api import Page, expect
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+AG_GRID_ROWS = ".ag-center-cols-container .ag-row"
+OVERLAY_BACKDROP = ".cdk-overlay-backdrop"
+
+# Count plus first/last row identity; row-id for AG Grid rows, text for anything else
+_SIGNATURE_SCRIPT = """
+(selector) => {
+    const rows = [...document.querySelectorAll(selector)];
+    const key = (el) => el ? (el.getAttribute('row-id') || el.textContent.trim()) : '';
+    return rows.length + '|' + key(rows[0]) + '|' + key(rows[rows.length - 1]);
+}
+"""
+
+# Truthy (the signature) once rows are unchanged for quietMs, no AG Grid loading
+# overlay is shown and, when given, the signature differs from previous
+_SETTLED_SCRIPT = """
+([selector, quietMs, previous]) => {
+    const rows = [...document.querySelectorAll(selector)];
+    const key = (el) => el ? (el.getAttribute('row-id') || el.textContent.trim()) : '';
+    const signature = rows.length + '|' + key(rows[0]) + '|' + key(rows[rows.length - 1]);
+    const state = window.__hitlSettle || (window.__hitlSettle = {});
+    const now = performance.now();
+    if (state.selector !== selector || state.signature !== signature) {
+        state.selector = selector;
+        state.signature = signature;
+        state.since = now;
+    }
+    const loading = document.querySelector('.ag-overlay-loading-wrapper');
+    if (loading && loading.offsetParent !== null) {
+        return false;
+    }
+    if (previous !== null && signature === previous) {
+        return false;
+    }
+    return now - state.since >= quietMs ? signature : false;
+}
+"""
+
+_ROW_COUNT_SCRIPT = """
+([selector, minimum, previous]) => {
+    const count = document.querySelectorAll(selector).length;
+    if (minimum !== null && count < minimum) {
+        return false;
+    }
+    if (previous !== null && count === previous) {
+        return false;
+    }
+    return count + 1;
+}
+"""
+
+
+class WaitStats:
+    """Total time and call count per wait label, for the end-of-session summary."""
+
+    def __init__(self):
+        self._totals = defaultdict(lambda: [0, 0.0])
+        self._lock = threading.Lock()
+
+    def record(self, label: str, elapsed_ms: float):
+        with self._lock:
+            entry = self._totals[label]
+            entry[0] += 1
+            entry[1] += elapsed_ms
+
+    def log_stats(self):
+        with self._lock:
+            totals = sorted(self._totals.items(), key=lambda item: item[1][1], reverse=True)
+        if not totals:
+            return
+        hitlLogger.info("⏱️ UI wait time by label:")
+        for label, (count, total_ms) in totals:
+            hitlLogger.info(f"   {label}: {count} wait(s), {total_ms / 1000:.2f}s total, "
+                            f"{total_ms / count:.0f}ms avg")
+
+
+_wait_stats = WaitStats()
+
+
+def get_wait_stats() -> WaitStats:
+    return _wait_stats
+
+
+@contextmanager
+def timed_wait(label: str, log: bool = True):
+    """Records (and logs, unless log=False) how long the wrapped wait took, whether it succeeded or timed out."""
+    start = time.perf_counter()
+    outcome = "timed out"
+    try:
+        yield
+        outcome = "done"
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        _wait_stats.record(label, elapsed_ms)
+        if log:
+            hitlLogger.info(f"⏱️ Wait '{label}' {outcome} in {elapsed_ms:.0f}ms")
+
+
+def grid_signature(page: Page, row_selector: str = AG_GRID_ROWS) -> str:
+    """Cheap fingerprint of the rendered rows, to pass as changed_from before an action."""
+    return page.evaluate(_SIGNATURE_SCRIPT, row_selector)
+
+
+def wait_for_grid_settled(page: Page, row_selector: str = AG_GRID_ROWS, changed_from: str = None,
+                          quiet_ms: int = 250, timeout: int = 10000, label: str = "grid settled") -> str:
+    """
+    Waits until the rows matching row_selector stop changing for quiet_ms and
+    no loading overlay is visible. With changed_from (a grid_signature taken
+    before the action), the rows must also differ from that state, e.g. after
+    paging. Returns the settled signature.
+    """
+    with timed_wait(label):
+        handle = page.wait_for_function(_SETTLED_SCRIPT, arg=[row_selector, quiet_ms, changed_from],
+                                        polling=50, timeout=timeout)
+        return handle.json_value()
+
+
+def wait_for_row_count(page: Page, row_selector: str = AG_GRID_ROWS, minimum: int = None,
+                       changed_from: int = None, timeout: int = 10000, label: str = "row count") -> int:
+    """Waits until at least minimum rows exist and/or the count differs from changed_from. Returns the count."""
+    with timed_wait(label):
+        handle = page.wait_for_function(_ROW_COUNT_SCRIPT, arg=[row_selector, minimum, changed_from],
+                                        timeout=timeout)
+        # The script returns count + 1 so an empty result is still truthy
+        return handle.json_value() - 1
+
+
+def wait_for_overlay_closed(page: Page, selector: str = OVERLAY_BACKDROP, timeout: int = 5000,
+                            label: str = "overlay closed"):
+    """Waits until no element matches selector (Material backdrop by default)."""
+    with timed_wait(label):
+        expect(page.locator(selector)).to_have_count(0, timeout=timeout)
+
+
+def wait_for_response(page: Page, url_pattern: str, action: Callable, timeout: int = 10000,
+                      label: str = None):
+    """Runs action and returns the first response whose URL matches the url_pattern regex."""
+    pattern = re.compile(url_pattern)
+    with timed_wait(label or f"response {url_pattern}"):
+        with page.expect_response(lambda response: pattern.search(response.url), timeout=timeout) as info:
+            action()
+        return info.value
+
+
+def wait_for_xhr_idle(page: Page, url_pattern: str, action: Optional[Callable] = None, idle_ms: int = 300,
+                      timeout: int = 10000, label: str = None):
+    """
+    Runs action (optional), then waits until no fetch/XHR request matching the
+    url_pattern regex has been in flight for idle_ms. Unlike the page-wide
+    "networkidle" state this ignores polling, telemetry and asset traffic.
+    """
+    pattern = re.compile(url_pattern)
+    in_flight = set()
+    last_activity = [time.perf_counter()]
+
+    def matches(request):
+        return request.resource_type in ("xhr", "fetch") and pattern.search(request.url)
+
+    def on_start(request):
+        if matches(request):
+            in_flight.add(request)
+            last_activity[0] = time.perf_counter()
+
+    def on_end(request):
+        if request in in_flight:
+            in_flight.discard(request)
+            last_activity[0] = time.perf_counter()
+
+    page.on("request", on_start)
+    page.on("requestfinished", on_end)
+    page.on("requestfailed", on_end)
+    try:
+        with timed_wait(label or f"xhr idle {url_pattern}"):
+            if action:
+                action()
+            deadline = time.perf_counter() + timeout / 1000
+            while in_flight or (time.perf_counter() - last_activity[0]) * 1000 < idle_ms:
+                if time.perf_counter() > deadline:
+                    raise TimeoutError(f"{len(in_flight)} request(s) matching '{url_pattern}' still in flight "
+                                       f"after {timeout}ms")
+                # Short event-loop turn so Playwright can dispatch request events
+                page.wait_for_timeout(50)
+    finally:
+        page.remove_listener("request", on_start)
+        page.remove_listener("requestfinished", on_end)
+        page.remove_listener("requestfailed", on_end)
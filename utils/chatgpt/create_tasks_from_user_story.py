@@ -1,9 +1,10 @@
 import base64
 import os
 
-import requests
 from openai import OpenAI
 
+from utils.ado.ado_client import get_ado_client
+
 # --------- CONFIG ---------
 ORG = "vizientinc"  # Your Azure DevOps organization
 PROJECT = "MDM"  # Your ADO project
@@ -22,7 +23,7 @@ client = OpenAI(api_key=OPENAI_API_KEY)
 
 def get_user_story_details(story_id):
     url = f"{ADO_API_URL}/wit/workitems/{story_id}?api-version=7.0"
-    response = requests.get(url, headers=HEADERS)
+    response = get_ado_client().get(url, headers=HEADERS)
 
     print(f"🔍 Request URL: {url}")
     print(f"📦 Status code: {response.status_code}")
@@ -71,7 +72,7 @@ def create_child_task(parent_id, title, description):
             "attributes": {"comment": "Auto-created child task"}
         }}
     ]
-    response = requests.post(url, headers=HEADERS, json=body)
+    response = get_ado_client().post(url, headers=HEADERS, json=body)
 
     if not response.ok:
         print("❌ ADO Task Creation Failed")
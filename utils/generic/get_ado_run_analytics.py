@@ -2,7 +2,7 @@ import base64
 import os
 from collections import Counter
 
-import requests
+from utils.ado.ado_client import get_ado_client
 
 ORG = "Vizientinc"
 PROJECT = "VizTech"
@@ -21,7 +21,7 @@ HEADERS = {
 
 def get_test_results(run_id):
     url = f"{base_url}/test/runs/{run_id}/results?api-version=7.1-preview.6"
-    response = requests.get(url, headers=HEADERS)
+    response = get_ado_client().get(url, headers=HEADERS)
     print(f"Fetching results for Run ID {run_id} - Status Code:", response.status_code)
     if response.status_code != 200:
         print("Error:", response.text)
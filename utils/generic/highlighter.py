@@ -1,12 +1,17 @@
-import time
+from utils.browser.waits import timed_wait
+
+# Flashes orange then red and clears itself in the browser, so the test does not block on the effect
+_FLASH_SCRIPT = """
+element => {
+    element.scrollIntoView({ behavior: 'auto', block: 'center', inline: 'center' });
+    element.style.border = '4px solid orange';
+    setTimeout(() => { element.style.border = '5px solid red'; }, 200);
+    setTimeout(() => { element.style.border = 'none'; }, 300);
+}
+"""
 
 
 def highlight(locator):
-    locator.wait_for(state="visible", timeout=60000)
-    locator.evaluate("element => element.scrollIntoView({ behavior: 'auto', block: 'center', inline: 'center' })")
-    locator.evaluate("element => element.setAttribute('style', 'border: 4px solid orange;')")
-    time.sleep(0.2)
-    locator.evaluate("element => element.setAttribute('style', 'border: 5px solid red;')")
-    time.sleep(0.1)
-    locator.evaluate("element => element.setAttribute('style', 'border: none;')")
-    time.sleep(0.2)
+    with timed_wait("highlight visible", log=False):
+        locator.wait_for(state="visible", timeout=60000)
+    locator.evaluate(_FLASH_SCRIPT)
@@ -0,0 +1,62 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+hitlLogger = logging.getLogger("HitlLogger")
+
+
+def run_task_graph(tasks: dict, max_workers: int = 6, label: str = "Task graph") -> dict:
+    """
+    Runs a small dependency graph of blocking calls, starting each task as soon
+    as its dependencies finished. Tasks are given as
+    {name: (func, [dependency names])}; func receives the dependency results as
+    keyword arguments. Returns {name: result} and logs per-task timings plus the
+    critical path versus the sequential sum. The first failing task cancels
+    everything not yet started and its exception is re-raised.
+    """
+    for name, (_, deps) in tasks.items():
+        missing = [dep for dep in deps if dep not in tasks]
+        if missing:
+            raise ValueError(f"{label}: task '{name}' depends on unknown task(s) {missing}")
+
+    results = {}
+    timings = {}
+    running = {}
+    pending = dict(tasks)
+    graph_start = time.perf_counter()
+
+    def timed(name, func, kwargs):
+        start = time.perf_counter()
+        try:
+            return func(**kwargs)
+        finally:
+            timings[name] = (start - graph_start, time.perf_counter() - graph_start)
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-graph") as executor:
+        while pending or running:
+            for name, (func, deps) in list(pending.items()):
+                if all(dep in results for dep in deps):
+                    kwargs = {dep: results[dep] for dep in deps}
+                    running[executor.submit(timed, name, func, kwargs)] = name
+                    del pending[name]
+
+            if not running:
+                raise ValueError(f"{label}: dependency cycle between {sorted(pending)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    for other in running:
+                        other.cancel()
+                    hitlLogger.info(f"❌ {label}: '{name}' failed")
+                    raise
+
+    total = time.perf_counter() - graph_start
+    sequential = sum(end - start for start, end in timings.values())
+    hitlLogger.info(f"⏱️ {label} finished in {total:.2f}s (sequential sum {sequential:.2f}s):")
+    for name, (start, end) in sorted(timings.items(), key=lambda kv: kv[1][0]):
+        hitlLogger.info(f"   {name}: {end - start:.2f}s (started at +{start:.2f}s)")
+    return results